@@ -3,29 +3,25 @@ UI Module for AI Assistant using Rich library
 Provides beautiful console output with panels, syntax highlighting, and status updates
 """
 
-from rich.console import Console
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Union
+
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.syntax import Syntax
-from rich.live import Live
 from rich.table import Table
 from rich.prompt import Prompt
 from rich.status import Status
-from rich.layout import Layout
 from rich import box
 from rich.text import Text
-import time
-
-
-class AssistantUI:
-    """Beautiful UI for the AI Assistant using Rich library"""
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
 
-    def __init__(self):
-        self.console = Console()
-
-    def show_welcome(self):
-        """Display welcome banner"""
-        welcome_text = """
+WELCOME_TEXT = """
 # 🤖 AI Assistant
         
 Welcome to your AI-powered file assistant!
@@ -36,19 +32,135 @@ Welcome to your AI-powered file assistant!
 - Type `/model` to switch between AI models
 - Type `quit`, `exit`, or `q` to exit
         """
-        self.console.print(
-            Panel(
-                Markdown(welcome_text),
-                title="[bold cyan]Welcome[/bold cyan]",
-                border_style="cyan",
-                box=box.DOUBLE,
-            )
+
+GOODBYE_TEXT = "[bold cyan]👋 Thank you for using AI Assistant!\n\nGoodbye![/bold cyan]"
+PLAIN_GOODBYE_TEXT = "👋 Thank you for using AI Assistant!\n\nGoodbye!"
+
+
+@lru_cache(maxsize=64)
+def _panel_shell(title: str, border_style: str, box_name: str) -> dict:
+    """
+    Return the constant Panel keyword arguments for a title/style/box combination.
+
+    The title markup is parsed into a Text once; Panel copies it before
+    rendering, so the same Text can be shared between panels.
+
+    Args:
+        title (str): Title with Rich markup
+        border_style (str): Border style name
+        box_name (str): Name of a box style in ``rich.box``
+
+    Returns:
+        dict: Keyword arguments to pass to Panel
+    """
+    return {
+        "title": Text.from_markup(title),
+        "border_style": border_style,
+        "box": getattr(box, box_name),
+    }
+
+
+class BufferedConsole(Console):
+    """Console that can collect renderables and print them in a single pass"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending: list[RenderableType] = []
+
+    def write(self, renderable: RenderableType = ""):
+        """Queue a renderable until the next flush"""
+        self._pending.append(renderable)
+
+    def flush(self):
+        """Render all queued renderables as one group"""
+        if not self._pending:
+            return
+        renderables, self._pending = self._pending, []
+        super().print(Group(*renderables))
+
+
+class AssistantUI:
+    """Beautiful UI for the AI Assistant using Rich library"""
+
+    def __init__(self):
+        self.console = BufferedConsole()
+        self._batching = False
+        # When piped or redirected, skip Rich rendering and write plain text
+        self._plain = not self.console.is_terminal
+
+        # Static panels never change, so build (and parse the Markdown) once
+        self._welcome_panel = Panel(
+            Markdown(WELCOME_TEXT),
+            title="[bold cyan]Welcome[/bold cyan]",
+            border_style="cyan",
+            box=box.DOUBLE,
+        )
+        self._goodbye_panel = Panel(
+            GOODBYE_TEXT,
+            border_style="cyan",
+            box=box.DOUBLE,
         )
-        self.console.print()
+        # Separator is rebuilt only when the char, style or terminal width changes
+        self._separator_key = None
+        self._separator = None
+
+        # Syntax highlighting theme and lexers are loaded once and reused
+        self._theme = Syntax.get_theme("monokai")
+        self._lexers = {}
+
+    def _render(self, renderable: RenderableType = ""):
+        """Print a renderable now, or queue it while inside batch()"""
+        if self._batching:
+            self.console.write(renderable)
+        else:
+            self.console.print(renderable)
+
+    def _print_plain(self, text: str = "", title: str = None):
+        """Write plain text straight to the console's file, bypassing Rich"""
+        if title:
+            text = f"[{title}]\n{text}" if text else f"[{title}]"
+        self.console.file.write(text + "\n")
+
+    def _get_lexer(self, language: str):
+        """Return a cached Pygments lexer for a language name"""
+        lexer = self._lexers.get(language)
+        if lexer is None:
+            try:
+                lexer = get_lexer_by_name(language)
+            except ClassNotFound:
+                lexer = get_lexer_by_name("text")
+            self._lexers[language] = lexer
+        return lexer
+
+    @contextmanager
+    def batch(self):
+        """Collect everything shown inside the block and render it at once"""
+        if self._batching:
+            yield self
+            return
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self.console.flush()
+
+    def show_welcome(self):
+        """Display welcome banner"""
+        if self._plain:
+            return self._print_plain(WELCOME_TEXT.strip() + "\n")
+        self._render(self._welcome_panel)
+        self._render()
 
     def show_separator(self, char="─", style="dim"):
         """Show a separator line"""
-        self.console.print(char * self.console.width, style=style)
+        if self._plain:
+            return self._print_plain(char * 40)
+        key = (char, style, self.console.width)
+        if key != self._separator_key:
+            self._separator_key = key
+            self._separator = Text(char * self.console.width, style=style)
+        self._render(self._separator)
 
     def get_user_input(self) -> str:
         """Get user input with nice formatting"""
@@ -56,110 +168,178 @@ Welcome to your AI-powered file assistant!
 
     def show_user_message(self, message: str):
         """Display user message"""
-        self.console.print(
+        if self._plain:
+            return self._print_plain(message, "You")
+        self._render(
             Panel(
                 message,
-                title="[bold green]You[/bold green]",
-                border_style="green",
-                box=box.ROUNDED,
+                **_panel_shell("[bold green]You[/bold green]", "green", "ROUNDED"),
             )
         )
 
     def show_ai_message(self, message: str):
         """Display AI response"""
-        self.console.print(
+        if self._plain:
+            return self._print_plain(message or "No response", "AI Assistant")
+        self._render(
             Panel(
                 Markdown(message) if message else "[dim]No response[/dim]",
-                title="[bold blue]AI Assistant[/bold blue]",
-                border_style="blue",
-                box=box.ROUNDED,
+                **_panel_shell("[bold blue]AI Assistant[/bold blue]", "blue", "ROUNDED"),
             )
         )
 
     def show_tool_call(self, tool_name: str, args: dict = None):
         """Display tool being called"""
+        if self._plain:
+            lines = [f"🔧 {tool_name}"]
+            if args:
+                lines.extend(f"  • {k}: {v}" for k, v in args.items())
+            return self._print_plain("\n".join(lines), "Tool Call")
+
         args_text = ""
         if args:
             args_formatted = "\n".join([f"  • {k}: {v}" for k, v in args.items()])
             args_text = f"\n\n[dim]Parameters:[/dim]\n{args_formatted}"
 
-        self.console.print(
+        self._render(
             Panel(
                 f"[bold yellow]🔧 {tool_name}[/bold yellow]{args_text}",
-                title="[bold yellow]Tool Call[/bold yellow]",
-                border_style="yellow",
-                box=box.ROUNDED,
+                **_panel_shell("[bold yellow]Tool Call[/bold yellow]", "yellow", "ROUNDED"),
                 padding=(0, 1),
             )
         )
 
     def show_tool_result(self, result: str):
         """Display tool execution result"""
-        self.console.print(
+        if self._plain:
+            return self._print_plain(f"✓ {result}", "Result")
+        self._render(
             Panel(
                 f"[green]✓[/green] {result}",
-                title="[bold green]Result[/bold green]",
-                border_style="green",
-                box=box.ROUNDED,
+                **_panel_shell("[bold green]Result[/bold green]", "green", "ROUNDED"),
                 padding=(0, 1),
             )
         )
 
-    def show_diff(self, diff: str, max_lines: int = 10):
+    @staticmethod
+    def _truncate_diff_text(diff: str, max_lines: int):
         """
-        Display a diff with syntax highlighting, truncating if too long.
+        Cut a diff string down to its first lines without splitting it.
 
         Args:
-            diff (str): The diff content to display
-            max_lines (int): Maximum number of lines to show before truncating
+            diff (str): The diff content
+            max_lines (int): Maximum number of lines to keep
+
+        Returns:
+            tuple: The kept text (without its final newline) and the total
+                number of lines in the diff
         """
-        if not diff:
-            return
+        # Find the end of the last line we will show
+        cut = -1
+        for _ in range(max_lines):
+            cut = diff.find("\n", cut + 1)
+            if cut < 0:
+                break
+
+        if 0 <= cut < len(diff) - 1:
+            # Count the rest without copying it
+            total_lines = max_lines + diff.count("\n", cut + 1)
+            if not diff.endswith("\n"):
+                total_lines += 1
+            return diff[:cut], total_lines
+
+        return diff, diff.count("\n") + (not diff.endswith("\n"))
+
+    @staticmethod
+    def _truncate_diff_lines(lines: Iterable[str], max_lines: int):
+        """
+        Take the first lines of a streamed diff and count the rest.
 
-        diff_lines = diff.splitlines()
-        total_lines = len(diff_lines)
+        Only ``max_lines`` lines are ever held in memory.
+
+        Args:
+            lines (Iterable[str]): Newline-terminated diff lines
+            max_lines (int): Maximum number of lines to keep
 
+        Returns:
+            tuple: The kept text and the total number of lines in the diff
+        """
+        lines = iter(lines)
+        kept = list(islice(lines, max_lines))
+        total_lines = len(kept) + sum(1 for _ in lines)
+        displayed_diff = "".join(kept)
         if total_lines > max_lines:
-            # Truncate and add indicator
-            displayed_diff = "\n".join(diff_lines[:max_lines])
-            displayed_diff += f"\n\n... ({total_lines - max_lines} more lines omitted)"
-            truncated = True
+            # Drop only the newline ending the last kept line, as the string
+            # path does, so trailing blank lines stay part of the diff
+            displayed_diff = displayed_diff.removesuffix("\n")
+        return displayed_diff, total_lines
+
+    def show_diff(self, diff: Union[str, Iterable[str]], max_lines: int = 10):
+        """
+        Display a diff with syntax highlighting, truncating if too long.
+
+        Args:
+            diff (str | Iterable[str]): The diff content to display, either as a
+                string or as an iterable of newline-terminated lines
+            max_lines (int): Maximum number of lines to show before truncating;
+                zero or less shows the whole diff
+        """
+        if max_lines <= 0:
+            max_lines = sys.maxsize  # No limit
+
+        if isinstance(diff, str):
+            if not diff:
+                return
+            displayed_diff, total_lines = self._truncate_diff_text(diff, max_lines)
         else:
-            displayed_diff = diff
-            truncated = False
+            displayed_diff, total_lines = self._truncate_diff_lines(diff, max_lines)
+            if not total_lines:
+                return
+
+        truncated = total_lines > max_lines
+        if truncated:
+            displayed_diff += f"\n\n... ({total_lines - max_lines} more lines omitted)"
+
+        if self._plain:
+            return self._print_plain(displayed_diff.rstrip("\n"), "Diff")
 
         # Use Syntax for diff highlighting
-        syntax = Syntax(displayed_diff, "diff", theme="monokai", line_numbers=False)
+        syntax = Syntax(
+            displayed_diff,
+            self._get_lexer("diff"),
+            theme=self._theme,
+            line_numbers=False,
+        )
 
         title = "[bold magenta]📝 Diff"
         if truncated:
             title += f" (showing {max_lines}/{total_lines} lines)"
         title += "[/bold magenta]"
 
-        self.console.print(
+        self._render(
             Panel(
                 syntax,
-                title=title,
-                border_style="magenta",
-                box=box.ROUNDED,
+                **_panel_shell(title, "magenta", "ROUNDED"),
                 padding=(0, 1),
             )
         )
 
     def show_error(self, error: str):
         """Display error message"""
-        self.console.print(
+        if self._plain:
+            return self._print_plain(f"✗ {error}", "Error")
+        self._render(
             Panel(
                 f"[bold red]✗[/bold red] {error}",
-                title="[bold red]Error[/bold red]",
-                border_style="red",
-                box=box.HEAVY,
+                **_panel_shell("[bold red]Error[/bold red]", "red", "HEAVY"),
             )
         )
 
     def show_info(self, message: str):
         """Display info message"""
-        self.console.print(f"[dim cyan]ℹ {message}[/dim cyan]")
+        if self._plain:
+            return self._print_plain(f"ℹ {message}")
+        self._render(f"[dim cyan]ℹ {message}[/dim cyan]")
 
     def show_thinking(self):
         """Show a thinking status"""
@@ -173,19 +353,19 @@ Welcome to your AI-powered file assistant!
 
     def show_goodbye(self):
         """Display goodbye message"""
-        self.console.print("\n")
-        self.console.print(
-            Panel(
-                "[bold cyan]👋 Thank you for using AI Assistant!\n\nGoodbye![/bold cyan]",
-                border_style="cyan",
-                box=box.DOUBLE,
-            )
-        )
+        if self._plain:
+            return self._print_plain("\n" + PLAIN_GOODBYE_TEXT)
+        self._render("\n")
+        self._render(self._goodbye_panel)
 
     def show_file_content(self, filename: str, content: str, language: str = "python"):
         """Display file content with syntax highlighting"""
-        syntax = Syntax(content, language, theme="monokai", line_numbers=True)
-        self.console.print(
+        if self._plain:
+            return self._print_plain(content.rstrip("\n"), f"📄 {filename}")
+        syntax = Syntax(
+            content, self._get_lexer(language), theme=self._theme, line_numbers=True
+        )
+        self._render(
             Panel(
                 syntax,
                 title=f"[bold magenta]📄 {filename}[/bold magenta]",
@@ -196,7 +376,9 @@ Welcome to your AI-powered file assistant!
 
     def show_model_info(self, model: str):
         """Display current model information"""
-        self.console.print(f"[dim]Using model: {model}[/dim]\n")
+        if self._plain:
+            return self._print_plain(f"Using model: {model}\n")
+        self._render(f"[dim]Using model: {model}[/dim]\n")
 
     def show_model_selector(self, models: list, current_model: str) -> str:
         """Display model selection menu and return selected model"""
@@ -255,4 +437,7 @@ Welcome to your AI-powered file assistant!
 
     def show_stats(self, stats: dict):
         """Display statistics"""
-        self.console.print(self.create_stats_table(stats))
+        if self._plain:
+            lines = [f"{key}: {value}" for key, value in stats.items()]
+            return self._print_plain("\n".join(lines), "Session Statistics")
+        self._render(self.create_stats_table(stats))
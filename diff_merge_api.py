@@ -8,12 +8,16 @@ Part of the file operations toolkit.
 from typing import Dict, List, Optional, Tuple
 from dataclasses import asdict
 import json
+import os
 
 from file_diff import DiffGenerator, FileDiff
 from dir_diff import DirectoryDiffer, DirectoryDiff
 from file_merge import ThreeWayMerger, MergeResult, MergeConflict
 from patch_handler import PatchHandler, PatchResult
 
+# Maximum number of file pair diffs kept by DiffMergeAPI
+FILE_DIFF_CACHE_SIZE = 256
+
 
 class DiffMergeAPI:
     """High-level API for diff and merge operations."""
@@ -28,6 +32,10 @@ class DiffMergeAPI:
         """
         self.diff_generator = DiffGenerator(context_lines=3)
         self.directory_differ = DirectoryDiffer(diff_generator=self.diff_generator)
+        # Differs for extension filters, keyed by the sorted extensions
+        self._differ_cache: Dict[Tuple[str, ...], DirectoryDiffer] = {}
+        # File diffs keyed by path pair, valid while both files are unchanged
+        self._file_diff_cache: Dict[Tuple[str, str], Tuple[Tuple, FileDiff]] = {}
         self.merger = ThreeWayMerger()
         self.patch_handler = PatchHandler(
             create_backups=create_backups, backup_dir=backup_dir
@@ -35,6 +43,40 @@ class DiffMergeAPI:
 
     # ============ FILE DIFF OPERATIONS ============
 
+    @staticmethod
+    def _file_signature(file_path: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) for a file, or None if it can't be stat'ed."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _diff_files(self, file_old: str, file_new: str) -> FileDiff:
+        """
+        Diff two files, reusing the previous result if neither file changed.
+
+        Args:
+            file_old: Path to original file
+            file_new: Path to new file
+
+        Returns:
+            FileDiff object with differences
+        """
+        key = (file_old, file_new)
+        signature = (self._file_signature(file_old), self._file_signature(file_new))
+        cached = self._file_diff_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        file_diff = self.diff_generator.diff_files(file_old, file_new)
+        self._file_diff_cache.pop(key, None)
+        if len(self._file_diff_cache) >= FILE_DIFF_CACHE_SIZE:
+            # Drop the oldest entry
+            del self._file_diff_cache[next(iter(self._file_diff_cache))]
+        self._file_diff_cache[key] = (signature, file_diff)
+        return file_diff
+
     def diff_files(self, file_old: str, file_new: str) -> Dict:
         """
         Compare two files and return diff.
@@ -46,7 +88,7 @@ class DiffMergeAPI:
         Returns:
             Dictionary with diff information
         """
-        file_diff = self.diff_generator.diff_files(file_old, file_new)
+        file_diff = self._diff_files(file_old, file_new)
 
         return {
             "file_old": file_diff.file_path_old,
@@ -57,12 +99,17 @@ class DiffMergeAPI:
             "is_binary": file_diff.is_binary,
             "diff_lines": [
                 {
-                    "type": line.line_type,
-                    "content": line.content.rstrip("\n"),
-                    "line_old": line.line_number_old,
-                    "line_new": line.line_number_new,
+                    "type": line_type,
+                    "content": content.rstrip("\n"),
+                    "line_old": line_old,
+                    "line_new": line_new,
                 }
-                for line in file_diff.lines
+                for line_type, content, line_old, line_new in zip(
+                    file_diff.line_types,
+                    file_diff.contents,
+                    file_diff.line_numbers_old,
+                    file_diff.line_numbers_new,
+                )
             ],
         }
 
@@ -77,7 +124,7 @@ class DiffMergeAPI:
         Returns:
             Dictionary with summary statistics
         """
-        file_diff = self.diff_generator.diff_files(file_old, file_new)
+        file_diff = self._diff_files(file_old, file_new)
         return self.diff_generator.get_diff_stats(file_diff)
 
     def format_diff_readable(self, file_old: str, file_new: str) -> str:
@@ -91,11 +138,35 @@ class DiffMergeAPI:
         Returns:
             Formatted diff string
         """
-        file_diff = self.diff_generator.diff_files(file_old, file_new)
+        file_diff = self._diff_files(file_old, file_new)
         return self.diff_generator.format_diff_readable(file_diff)
 
     # ============ DIRECTORY DIFF OPERATIONS ============
 
+    def _get_directory_differ(
+        self, extensions_filter: Optional[List[str]] = None
+    ) -> DirectoryDiffer:
+        """
+        Get a DirectoryDiffer for an extension filter, reusing earlier ones.
+
+        Args:
+            extensions_filter: Optional list of file extensions to include
+
+        Returns:
+            DirectoryDiffer sharing this API's diff generator
+        """
+        if not extensions_filter:
+            return self.directory_differ
+
+        key = tuple(sorted(extensions_filter))
+        differ = self._differ_cache.get(key)
+        if differ is None:
+            differ = DirectoryDiffer(
+                diff_generator=self.diff_generator, extensions_filter=list(key)
+            )
+            self._differ_cache[key] = differ
+        return differ
+
     def diff_directories(
         self, dir_old: str, dir_new: str, extensions_filter: Optional[List[str]] = None
     ) -> Dict:
@@ -110,13 +181,7 @@ class DiffMergeAPI:
         Returns:
             Dictionary with directory diff information
         """
-        if extensions_filter:
-            differ = DirectoryDiffer(
-                diff_generator=self.diff_generator, extensions_filter=extensions_filter
-            )
-        else:
-            differ = self.directory_differ
-
+        differ = self._get_directory_differ(extensions_filter)
         dir_diff = differ.diff_directories(dir_old, dir_new)
         summary = dir_diff.get_summary()
 
@@ -161,13 +226,7 @@ class DiffMergeAPI:
         Returns:
             Formatted directory diff string
         """
-        if extensions_filter:
-            differ = DirectoryDiffer(
-                diff_generator=self.diff_generator, extensions_filter=extensions_filter
-            )
-        else:
-            differ = self.directory_differ
-
+        differ = self._get_directory_differ(extensions_filter)
         dir_diff = differ.diff_directories(dir_old, dir_new)
         return differ.format_directory_diff_readable(
             dir_diff, include_diffs=include_file_diffs
@@ -265,7 +324,7 @@ class DiffMergeAPI:
         Returns:
             Dictionary with patch result
         """
-        file_diff = self.diff_generator.diff_files(file_old, file_new)
+        file_diff = self._diff_files(file_old, file_new)
 
         # Validate patch first
         is_valid, issues = self.patch_handler.validate_patch_applicability(
@@ -312,7 +371,7 @@ class DiffMergeAPI:
         Returns:
             Dictionary with validation result
         """
-        file_diff = self.diff_generator.diff_files(file_old, file_new)
+        file_diff = self._diff_files(file_old, file_new)
         is_valid, issues = self.patch_handler.validate_patch_applicability(
             file_path, file_diff
         )
@@ -332,7 +391,7 @@ class DiffMergeAPI:
         Returns:
             Formatted report string
         """
-        file_diff = self.diff_generator.diff_files(file_old, file_new)
+        file_diff = self._diff_files(file_old, file_new)
         return self.diff_generator.format_diff_readable(file_diff)
 
     def get_change_statistics(self, file_old: str, file_new: str) -> Dict:
@@ -346,7 +405,7 @@ class DiffMergeAPI:
         Returns:
             Dictionary with statistics
         """
-        file_diff = self.diff_generator.diff_files(file_old, file_new)
+        file_diff = self._diff_files(file_old, file_new)
         stats = self.diff_generator.get_diff_stats(file_diff)
 
         total = stats["additions"] + stats["deletions"]
@@ -4,13 +4,20 @@ Provides diff generation between directories, showing file additions/deletions/m
 Part of the file operations toolkit.
 """
 
-from typing import List, Dict, Optional, Set
+from typing import Iterator, List, Dict, Optional
 from dataclasses import dataclass, field
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import filecmp
+import io
+import os
 from file_diff import DiffGenerator, FileDiff
 
+# Default cap on threads used to diff the files of two directories
+MAX_DIFF_WORKERS = 32
 
-@dataclass
+
+@dataclass(slots=True)
 class DirectoryDiffEntry:
     """Represents a file entry in a directory diff."""
 
@@ -20,7 +27,7 @@ class DirectoryDiffEntry:
     diff: Optional[FileDiff] = None  # For modified files
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectoryDiff:
     """Represents the complete diff between two directories."""
 
@@ -28,22 +35,26 @@ class DirectoryDiff:
     dir_new: str
     entries: List[DirectoryDiffEntry] = field(default_factory=list)
 
+    def _by_status(self, status: str) -> List[str]:
+        return [e.file_path for e in self.entries if e.status == status]
+
     def get_added_files(self) -> List[str]:
-        return [e.file_path for e in self.entries if e.status == "added"]
+        return self._by_status("added")
 
     def get_deleted_files(self) -> List[str]:
-        return [e.file_path for e in self.entries if e.status == "deleted"]
+        return self._by_status("deleted")
 
     def get_modified_files(self) -> List[str]:
-        return [e.file_path for e in self.entries if e.status == "modified"]
+        return self._by_status("modified")
 
     def get_summary(self) -> Dict[str, int]:
-        return {
-            "added": len(self.get_added_files()),
-            "deleted": len(self.get_deleted_files()),
-            "modified": len(self.get_modified_files()),
-            "total_files": len(self.entries),
-        }
+        # Tally every status in one pass instead of building three lists
+        summary = {"added": 0, "deleted": 0, "modified": 0}
+        for entry in self.entries:
+            if entry.status in summary:
+                summary[entry.status] += 1
+        summary["total_files"] = len(self.entries)
+        return summary
 
 
 class DirectoryDiffer:
@@ -53,6 +64,7 @@ class DirectoryDiffer:
         self,
         diff_generator: Optional[DiffGenerator] = None,
         extensions_filter: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize directory differ.
@@ -60,37 +72,91 @@ class DirectoryDiffer:
         Args:
             diff_generator: DiffGenerator instance (creates new if None)
             extensions_filter: Only compare files with these extensions (e.g., ['.py', '.txt'])
+            max_workers: Maximum threads used to diff files (default: up to 32,
+                never more than the number of files; 1 diffs serially)
         """
         self.diff_generator = diff_generator or DiffGenerator()
-        self.extensions_filter = extensions_filter
+        # A frozenset makes the per-file extension check O(1)
+        self.extensions_filter = (
+            frozenset(extensions_filter) if extensions_filter else None
+        )
+        self.max_workers = max_workers
+
+    def _scandir_recursive(self, directory: str) -> Iterator[os.DirEntry]:
+        """
+        Yield the file entries below a directory.
+
+        Uses os.scandir, whose entries carry the file type from the directory
+        listing, so no extra stat call is needed per entry. Symlinked
+        directories are not followed; unreadable directories are skipped.
+
+        Args:
+            directory: Directory path
 
-    def _get_relative_paths(self, directory: str) -> Set[str]:
+        Yields:
+            os.DirEntry for each file
         """
-        Get all file paths in directory relative to the directory.
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._scandir_recursive(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            return
+
+    def _get_relative_paths(self, directory: str) -> Dict[str, os.DirEntry]:
+        """
+        Get all files in directory keyed by their path relative to it.
+
+        The DirEntry objects are kept so later size checks reuse the stat
+        result cached on the entry instead of statting the path again.
 
         Args:
             directory: Directory path
 
         Returns:
-            Set of relative file paths
+            Dictionary mapping relative file paths to their DirEntry
         """
-        base_path = Path(directory)
-        if not base_path.exists():
-            return set()
+        base = str(Path(directory))
+        base_len = len(os.path.join(base, ""))
+
+        entries = self._scandir_recursive(base)
+
+        # Apply extension filter if provided
+        if self.extensions_filter:
+            extensions = self.extensions_filter
+            return {
+                entry.path[base_len:]: entry
+                for entry in entries
+                if os.path.splitext(entry.name)[1] in extensions
+            }
+
+        return {entry.path[base_len:]: entry for entry in entries}
 
-        relative_paths = set()
-        for file_path in base_path.rglob("*"):
-            if file_path.is_file():
-                rel_path = str(file_path.relative_to(base_path))
+    @staticmethod
+    def _same_contents(entry_old: os.DirEntry, entry_new: os.DirEntry) -> bool:
+        """
+        Check whether two files have identical bytes.
 
-                # Apply extension filter if provided
-                if self.extensions_filter:
-                    if file_path.suffix not in self.extensions_filter:
-                        continue
+        Files of different sizes are rejected from the cached stat results
+        without opening them; the rest are compared byte by byte by filecmp.
 
-                relative_paths.add(rel_path)
+        Args:
+            entry_old: Entry of the original file
+            entry_new: Entry of the new file
 
-        return relative_paths
+        Returns:
+            True if the contents match, False otherwise or if either file
+            can't be read
+        """
+        try:
+            if entry_old.stat().st_size != entry_new.stat().st_size:
+                return False
+            return filecmp.cmp(entry_old.path, entry_new.path, shallow=False)
+        except OSError:
+            return False
 
     def diff_directories(self, dir_old: str, dir_new: str) -> DirectoryDiff:
         """
@@ -108,27 +174,54 @@ class DirectoryDiffer:
 
         dir_diff = DirectoryDiff(dir_old=dir_old, dir_new=dir_new)
 
+        # Split the old files into deleted and common ones in a single pass,
+        # without building temporary difference/intersection sets
+        deleted_files = []
+        common_files = []
+        for file_path in files_old:
+            if file_path in files_new:
+                common_files.append(file_path)
+            else:
+                deleted_files.append(file_path)
+
         # Find deleted files
-        for file_path in files_old - files_new:
+        for file_path in deleted_files:
             dir_diff.entries.append(
                 DirectoryDiffEntry(file_path=file_path, status="deleted")
             )
 
         # Find added files
-        for file_path in files_new - files_old:
-            dir_diff.entries.append(
-                DirectoryDiffEntry(file_path=file_path, status="added")
-            )
+        for file_path in files_new:
+            if file_path not in files_old:
+                dir_diff.entries.append(
+                    DirectoryDiffEntry(file_path=file_path, status="added")
+                )
 
-        # Find modified files and generate diffs
-        for file_path in files_old & files_new:
-            old_full_path = str(Path(dir_old) / file_path)
-            new_full_path = str(Path(dir_new) / file_path)
+        # Find modified files and generate diffs. File reads release the GIL,
+        # so the pairs are diffed in a thread pool to overlap the I/O.
+        def diff_pair(file_path: str) -> FileDiff:
+            entry_old = files_old[file_path]
+            entry_new = files_new[file_path]
 
-            file_diff = self.diff_generator.diff_files(old_full_path, new_full_path)
+            # Identical files need no diff
+            if self._same_contents(entry_old, entry_new):
+                return FileDiff(
+                    file_path_old=entry_old.path, file_path_new=entry_new.path
+                )
 
-            # Only mark as modified if there are actual changes
-            if file_diff.additions > 0 or file_diff.deletions > 0:
+            return self.diff_generator.diff_files(entry_old.path, entry_new.path)
+
+        workers = min(self.max_workers or MAX_DIFF_WORKERS, len(common_files))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                file_diffs = list(executor.map(diff_pair, common_files))
+        else:
+            file_diffs = [diff_pair(file_path) for file_path in common_files]
+
+        for file_path, file_diff in zip(common_files, file_diffs):
+            # Only mark as modified if there are actual changes. Binary diffs
+            # carry no line counts, but identical files never get that far.
+            if file_diff.is_binary or file_diff.additions or file_diff.deletions:
                 dir_diff.entries.append(
                     DirectoryDiffEntry(
                         file_path=file_path, status="modified", diff=file_diff
@@ -156,47 +249,43 @@ class DirectoryDiffer:
         Returns:
             Formatted directory diff string
         """
-        output = []
-        output.append(f"Directory Diff: {dir_diff.dir_old} → {dir_diff.dir_new}")
-        output.append("=" * 80)
-
         summary = dir_diff.get_summary()
-        output.append(
+        buffer = io.StringIO()
+        write = buffer.write
+        write(f"Directory Diff: {dir_diff.dir_old} → {dir_diff.dir_new}\n")
+        write("=" * 80 + "\n")
+        write(
             f"Summary: +{summary['added']} -{summary['deleted']} "
-            f"Δ{summary['modified']} ({summary['total_files']} total)"
+            f"Δ{summary['modified']} ({summary['total_files']} total)\n"
         )
-        output.append("")
 
         # Added files
         if added := dir_diff.get_added_files():
-            output.append("ADDED FILES:")
+            write("\nADDED FILES:\n")
             for file_path in sorted(added):
-                output.append(f"  + {file_path}")
-            output.append("")
+                write(f"  + {file_path}\n")
 
         # Deleted files
         if deleted := dir_diff.get_deleted_files():
-            output.append("DELETED FILES:")
+            write("\nDELETED FILES:\n")
             for file_path in sorted(deleted):
-                output.append(f"  - {file_path}")
-            output.append("")
+                write(f"  - {file_path}\n")
 
-        # Modified files
-        if modified := dir_diff.get_modified_files():
-            output.append("MODIFIED FILES:")
+        # Modified files, looked up by path instead of searching the entries
+        modified = {e.file_path: e for e in dir_diff.entries if e.status == "modified"}
+        if modified:
+            write("\nMODIFIED FILES:\n")
             for file_path in sorted(modified):
-                entry = next(e for e in dir_diff.entries if e.file_path == file_path)
-                output.append(f"  Δ {file_path}")
+                entry = modified[file_path]
+                write(f"  Δ {file_path}\n")
                 if entry.diff:
                     stats = self.diff_generator.get_diff_stats(entry.diff)
-                    output.append(f"    +{stats['additions']} -{stats['deletions']}")
+                    write(f"    +{stats['additions']} -{stats['deletions']}\n")
 
                     if include_diffs:
-                        output.append("    " + "-" * 70)
+                        write("    " + "-" * 70 + "\n")
                         diff_text = self.diff_generator.format_diff_readable(entry.diff)
-                        for line in diff_text.split("\n"):
-                            output.append(f"    {line}")
-                        output.append("")
-            output.append("")
+                        # Indent every line of the diff, blank ones included
+                        write("    " + diff_text.replace("\n", "\n    ") + "\n\n")
 
-        return "\n".join(output)
+        return buffer.getvalue()
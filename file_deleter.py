@@ -1,5 +1,71 @@
 import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+# Upper bound on threads used by delete_files
+MAX_DELETE_WORKERS = 32
+
+# Tool schemas returned by FileDeleter.get_tools, built once at import
+_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "delete_file",
+            "description": "Delete a file at the specified path",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Path to the file to delete",
+                    }
+                },
+                "required": ["file_path"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "delete_files",
+            "description": "Delete several files at once",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_paths": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Paths to the files to delete",
+                    }
+                },
+                "required": ["file_paths"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "delete_directory",
+            "description": "Delete a directory at the specified path. Use recursive=True to delete non-empty directories.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "directory_path": {
+                        "type": "string",
+                        "description": "Path to the directory to delete",
+                    },
+                    "recursive": {
+                        "type": "boolean",
+                        "description": "If True, delete directory and all contents. If False, only delete if empty.",
+                        "default": False,
+                    },
+                },
+                "required": ["directory_path"],
+            },
+        },
+    },
+]
 
 
 class FileDeleter:
@@ -17,18 +83,48 @@ class FileDeleter:
         Returns:
             str: Success message or error message
         """
+        # A single stat answers both "does it exist" and "is it a regular
+        # file". It follows symlinks like os.path.exists and os.path.isfile:
+        # a dangling link is not found and a link to a directory is not a file.
         try:
-            if not os.path.exists(file_path):
+            try:
+                mode = os.stat(file_path).st_mode
+            except (OSError, ValueError):
                 return f"Error: File '{file_path}' not found"
-
-            if os.path.isfile(file_path):
-                os.remove(file_path)
-                return f"Successfully deleted file: {file_path}"
-            else:
+            if not stat.S_ISREG(mode):
                 return f"Error: '{file_path}' is not a file"
+
+            os.remove(file_path)
+            return f"Successfully deleted file: {file_path}"
         except Exception as e:
             return f"Error deleting file: {str(e)}"
 
+    def delete_files(self, file_paths):
+        """
+        Delete several files, one thread per file up to a limit.
+
+        Args:
+            file_paths (list): Paths of the files to delete
+
+        Returns:
+            str: One success or error message per file, in the given order
+        """
+        # A bare string would otherwise be deleted one character at a time
+        if not isinstance(file_paths, (list, tuple)) or not all(
+            isinstance(file_path, str) for file_path in file_paths
+        ):
+            return "Error: file_paths must be a list of path strings"
+        if not file_paths:
+            return "Error: No files given"
+
+        workers = min(MAX_DELETE_WORKERS, len(file_paths))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self.delete_file, file_paths))
+        else:
+            results = [self.delete_file(file_path) for file_path in file_paths]
+        return "\n".join(results)
+
     def delete_directory(self, directory_path, recursive=False):
         """
         Delete a directory at the specified path.
@@ -67,44 +163,4 @@ class FileDeleter:
         Returns:
             list: List of tool dictionaries with proper schema format.
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "delete_file",
-                    "description": "Delete a file at the specified path",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Path to the file to delete",
-                            }
-                        },
-                        "required": ["file_path"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "delete_directory",
-                    "description": "Delete a directory at the specified path. Use recursive=True to delete non-empty directories.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "directory_path": {
-                                "type": "string",
-                                "description": "Path to the directory to delete",
-                            },
-                            "recursive": {
-                                "type": "boolean",
-                                "description": "If True, delete directory and all contents. If False, only delete if empty.",
-                                "default": False,
-                            },
-                        },
-                        "required": ["directory_path"],
-                    },
-                },
-            },
-        ]
+        return _TOOLS
@@ -4,13 +4,30 @@ Provides unified diff generation between files and directories.
 Part of the file operations toolkit.
 """
 
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
-import difflib
+from typing import Iterable, List, Tuple, Optional
+from dataclasses import dataclass, field
 from pathlib import Path
+import io
+import os
+import threading
 
+# Use the C implementation of SequenceMatcher when it is installed
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
 
-@dataclass
+# Files with a NUL byte in this many leading bytes are treated as binary
+BINARY_SNIFF_BYTES = 8192
+
+# Maximum number of files whose lines DiffGenerator keeps in memory
+READ_CACHE_SIZE = 1024
+
+# Line prefixes used by format_diff_readable, keyed by diff line type
+_READABLE_PREFIXES = {"+": "\n+ ", "-": "\n- ", " ": "\n  "}
+
+
+@dataclass(slots=True)
 class DiffLine:
     """Represents a single line in a diff with metadata."""
 
@@ -20,21 +37,38 @@ class DiffLine:
     line_number_new: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDiff:
-    """Represents the complete diff between two files."""
+    """
+    Represents the complete diff between two files.
+
+    Diff lines are stored as parallel columns (one list per DiffLine field)
+    rather than one object per line; ``lines`` rebuilds the DiffLine view.
+    ``additions`` and ``deletions`` are counted by whoever builds the columns.
+    """
 
     file_path_old: str
     file_path_new: str
-    lines: List[DiffLine]
+    line_types: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    line_numbers_old: List[Optional[int]] = field(default_factory=list)
+    line_numbers_new: List[Optional[int]] = field(default_factory=list)
     additions: int = 0
     deletions: int = 0
     is_binary: bool = False
 
-    def __post_init__(self):
-        """Calculate statistics."""
-        self.additions = sum(1 for line in self.lines if line.line_type == "+")
-        self.deletions = sum(1 for line in self.lines if line.line_type == "-")
+    @property
+    def lines(self) -> List[DiffLine]:
+        """Diff lines as DiffLine objects."""
+        return [
+            DiffLine(*row)
+            for row in zip(
+                self.line_types,
+                self.contents,
+                self.line_numbers_old,
+                self.line_numbers_new,
+            )
+        ]
 
 
 class DiffGenerator:
@@ -48,11 +82,55 @@ class DiffGenerator:
             context_lines: Number of context lines to show around changes (default: 3)
         """
         self.context_lines = context_lines
+        # file_path -> ((mtime_ns, size), (lines, is_binary)) of the last read
+        self._read_cache = {}
+        # DirectoryDiffer reads files from several threads at once
+        self._read_cache_lock = threading.Lock()
+
+    def clear_cache(self):
+        """Forget all cached file contents."""
+        with self._read_cache_lock:
+            self._read_cache.clear()
 
     def _read_file_safely(self, file_path: str) -> Tuple[List[str], bool]:
         """
         Read file, handling binary files gracefully.
 
+        The result is reused while the file's modification time and size are
+        unchanged; the returned list must not be modified.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Tuple of (lines, is_binary)
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return [], False
+        except OSError:
+            stat = None
+
+        key = (stat.st_mtime_ns, stat.st_size) if stat else None
+        cached = self._read_cache.get(file_path)
+        if key is not None and cached is not None and cached[0] == key:
+            return cached[1]
+
+        result = self._read_file_uncached(file_path)
+        if key is not None:
+            with self._read_cache_lock:
+                self._read_cache.pop(file_path, None)
+                if len(self._read_cache) >= READ_CACHE_SIZE:
+                    # Drop the oldest entry
+                    del self._read_cache[next(iter(self._read_cache))]
+                self._read_cache[file_path] = (key, result)
+        return result
+
+    def _read_file_uncached(self, file_path: str) -> Tuple[List[str], bool]:
+        """
+        Read file from disk, handling binary files gracefully.
+
         Args:
             file_path: Path to file
 
@@ -60,8 +138,13 @@ class DiffGenerator:
             Tuple of (lines, is_binary)
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
+            with open(file_path, "rb") as f:
+                # Like git, treat a NUL byte near the start as a binary file,
+                # without reading or decoding the rest of it
+                if b"\0" in f.read(BINARY_SNIFF_BYTES):
+                    return [], True
+                f.seek(0)
+                lines = io.TextIOWrapper(f, encoding="utf-8").readlines()
             return lines, False
         except UnicodeDecodeError:
             return [], True
@@ -87,95 +170,90 @@ class DiffGenerator:
             return FileDiff(
                 file_path_old=file_path_old,
                 file_path_new=file_path_new,
-                lines=[],
                 is_binary=True,
             )
 
-        # Use difflib to generate unified diff
-        diff_lines = list(
-            difflib.unified_diff(
-                lines_old,
-                lines_new,
-                fromfile=file_path_old,
-                tofile=file_path_new,
-                n=self.context_lines,
-                lineterm="",
-            )
+        # Build the diff lines straight from the matcher's hunks instead of
+        # formatting unified diff text and parsing it back
+        matcher = SequenceMatcher(None, lines_old, lines_new)
+        columns, additions, deletions = self._build_diff_columns(
+            matcher.get_grouped_opcodes(self.context_lines), lines_old, lines_new
         )
-
-        # Parse unified diff into our format
-        parsed_lines = self._parse_unified_diff(diff_lines, lines_old, lines_new)
+        line_types, contents, line_numbers_old, line_numbers_new = columns
 
         return FileDiff(
-            file_path_old=file_path_old, file_path_new=file_path_new, lines=parsed_lines
+            file_path_old=file_path_old,
+            file_path_new=file_path_new,
+            line_types=line_types,
+            contents=contents,
+            line_numbers_old=line_numbers_old,
+            line_numbers_new=line_numbers_new,
+            additions=additions,
+            deletions=deletions,
         )
 
-    def _parse_unified_diff(
-        self, diff_lines: List[str], original_lines: List[str], new_lines: List[str]
-    ) -> List[DiffLine]:
+    def _build_diff_columns(
+        self,
+        groups: Iterable[List[Tuple[str, int, int, int, int]]],
+        original_lines: List[str],
+        new_lines: List[str],
+    ) -> Tuple[tuple, int, int]:
         """
-        Parse unified diff format into DiffLine objects.
+        Convert grouped SequenceMatcher opcodes into FileDiff columns.
+
+        The rows match the lines of a unified diff with the same context,
+        without the file and hunk headers.
 
         Args:
-            diff_lines: Lines from unified diff
+            groups: Hunks from SequenceMatcher.get_grouped_opcodes
             original_lines: Original file lines
             new_lines: New file lines
 
         Returns:
-            List of DiffLine objects
+            Tuple of ((line_types, contents, line_numbers_old, line_numbers_new),
+            additions, deletions)
         """
-        result = []
-        old_line_num = 0
-        new_line_num = 0
-
-        # Skip header lines
-        in_header = True
-
-        for line in diff_lines:
-            if in_header:
-                if line.startswith("---") or line.startswith("+++"):
+        line_types = []
+        contents = []
+        numbers_old = []
+        numbers_new = []
+        # Next line number to emit on each side
+        old_line_num = 1
+        new_line_num = 1
+        additions = 0
+        deletions = 0
+
+        for group in groups:
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    count = i2 - i1
+                    line_types.extend(" " * count)
+                    contents.extend(original_lines[i1:i2])
+                    numbers_old.extend(range(old_line_num, old_line_num + count))
+                    numbers_new.extend(range(new_line_num, new_line_num + count))
+                    old_line_num += count
+                    new_line_num += count
                     continue
-                if line.startswith("@@"):
-                    in_header = False
-                    continue
-
-            if not line:
-                continue
-
-            # Determine line type and extract content
-            if line.startswith("-"):
-                result.append(
-                    DiffLine(
-                        line_type="-",
-                        content=line[1:],
-                        line_number_old=old_line_num + 1,
-                        line_number_new=None,
-                    )
-                )
-                old_line_num += 1
-            elif line.startswith("+"):
-                result.append(
-                    DiffLine(
-                        line_type="+",
-                        content=line[1:],
-                        line_number_old=None,
-                        line_number_new=new_line_num + 1,
-                    )
-                )
-                new_line_num += 1
-            elif line.startswith(" "):
-                result.append(
-                    DiffLine(
-                        line_type=" ",
-                        content=line[1:],
-                        line_number_old=old_line_num + 1,
-                        line_number_new=new_line_num + 1,
-                    )
-                )
-                old_line_num += 1
-                new_line_num += 1
 
-        return result
+                if tag in ("replace", "delete"):
+                    count = i2 - i1
+                    line_types.extend("-" * count)
+                    contents.extend(original_lines[i1:i2])
+                    numbers_old.extend(range(old_line_num, old_line_num + count))
+                    numbers_new.extend([None] * count)
+                    old_line_num += count
+                    deletions += count
+                if tag in ("replace", "insert"):
+                    count = j2 - j1
+                    line_types.extend("+" * count)
+                    contents.extend(new_lines[j1:j2])
+                    numbers_old.extend([None] * count)
+                    numbers_new.extend(range(new_line_num, new_line_num + count))
+                    new_line_num += count
+                    additions += count
+
+        columns = (line_types, contents, numbers_old, numbers_new)
+        return columns, additions, deletions
 
     def format_diff_readable(self, file_diff: FileDiff) -> str:
         """
@@ -190,21 +268,19 @@ class DiffGenerator:
         if file_diff.is_binary:
             return f"Binary files differ: {file_diff.file_path_old} vs {file_diff.file_path_new}"
 
-        output = []
-        output.append(f"--- {file_diff.file_path_old}")
-        output.append(f"+++ {file_diff.file_path_new}")
-        output.append(f"Changes: +{file_diff.additions} -{file_diff.deletions}")
-        output.append("")
-
-        for line in file_diff.lines:
-            if line.line_type == "+":
-                output.append(f"+ {line.content}")
-            elif line.line_type == "-":
-                output.append(f"- {line.content}")
-            elif line.line_type == " ":
-                output.append(f"  {line.content}")
-
-        return "\n".join(output)
+        buffer = io.StringIO()
+        write = buffer.write
+        write(
+            f"--- {file_diff.file_path_old}\n+++ {file_diff.file_path_new}\n"
+            f"Changes: +{file_diff.additions} -{file_diff.deletions}\n"
+        )
+
+        for line_type, content in zip(file_diff.line_types, file_diff.contents):
+            if prefix := _READABLE_PREFIXES.get(line_type):
+                write(prefix)
+                write(content)
+
+        return buffer.getvalue()
 
     def get_diff_stats(self, file_diff: FileDiff) -> dict:
         """
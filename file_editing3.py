@@ -1,17 +1,356 @@
+import io
 import os
+import errno
+import re
+import shutil
 import difflib
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 try:
-    from python_validator import PythonValidator, has_ruff  # Try to import PythonValidator
+    from python_validator import PythonValidator  # Try to import PythonValidator
 except ImportError:
     PythonValidator = None
-    has_ruff = lambda: False  # Define as a function that always returns False
+
+# Lines of context shown around each change, matching difflib's default
+DIFF_CONTEXT_LINES = 3
+
+# Limits on the file contents kept in memory between edits. The least
+# recently used files are dropped first once either limit is exceeded.
+CONTENT_CACHE_MAX_FILES = 8
+CONTENT_CACHE_MAX_CHARS = 16 * 1024 * 1024
+
+# Number of successful Python validation results remembered per editor
+VALIDATION_CACHE_SIZE = 256
+
+# Threads used to run ruff for a batch of edits. ruff is multithreaded
+# itself, so only half the cores are used to avoid oversubscribing them.
+VALIDATION_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+
+# Matches a single newline, for indexing line start offsets
+_NEWLINE_RE = re.compile(r"\n")
+
+# Matches one line including its trailing newline (if any)
+_LINE_RE = re.compile(r"[^\n]*\n|[^\n]+")
+
+# Tool schemas returned by FileEditor.get_tools, built once at import
+_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "edit_file",
+            "description": "Edit a file at the specified path by writing content to it",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Relative path to the file to edit",
+                    },
+                    "content": {
+                        "type": "string",
+                        "description": "Content to write to the file",
+                    },
+                    "mode": {
+                        "type": "string",
+                        "description": "File opening mode ('w' for overwrite, 'a' for append)",
+                        "default": "w",
+                    },
+                },
+                "required": ["file_path", "content"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "edit_files_batch",
+            "description": "Edit several files at once, writing content to each",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "edits": {
+                        "type": "array",
+                        "description": "Edits to apply, in order",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "file_path": {
+                                    "type": "string",
+                                    "description": "Relative path to the file to edit",
+                                },
+                                "content": {
+                                    "type": "string",
+                                    "description": "Content to write to the file",
+                                },
+                                "mode": {
+                                    "type": "string",
+                                    "description": "File opening mode ('w' for overwrite, 'a' for append)",
+                                    "default": "w",
+                                },
+                            },
+                            "required": ["file_path", "content"],
+                        },
+                    },
+                },
+                "required": ["edits"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "insert_line",
+            "description": "Insert a line into a file at the specified line number",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Relative path to the file",
+                    },
+                    "line_number": {
+                        "type": "integer",
+                        "description": "Line number where to insert (0-indexed)",
+                    },
+                    "content": {
+                        "type": "string",
+                        "description": "Content to insert",
+                    },
+                },
+                "required": ["file_path", "line_number", "content"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "remove_line",
+            "description": "Remove a line from a file at the specified line number",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Relative path to the file",
+                    },
+                    "line_number": {
+                        "type": "integer",
+                        "description": "Line number to remove (0-indexed)",
+                    },
+                },
+                "required": ["file_path", "line_number"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "change_line",
+            "description": "Change the content of a specific line in a file",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Relative path to the file",
+                    },
+                    "line_number": {
+                        "type": "integer",
+                        "description": "Line number to change (0-indexed)",
+                    },
+                    "new_content": {
+                        "type": "string",
+                        "description": "New content for the line",
+                    },
+                },
+                "required": [
+                    "file_path",
+                    "line_number",
+                    "new_content",
+                ],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "apply_edits",
+            "description": "Apply several line edits to a file at once. Line numbers refer to the file before any of the edits.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Relative path to the file",
+                    },
+                    "edits": {
+                        "type": "array",
+                        "description": "Line edits to apply",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "op": {
+                                    "type": "string",
+                                    "enum": ["insert", "remove", "change"],
+                                    "description": "Kind of edit",
+                                },
+                                "line_number": {
+                                    "type": "integer",
+                                    "description": "Line number to edit (0-indexed)",
+                                },
+                                "content": {
+                                    "type": "string",
+                                    "description": "Line content for inserts and changes",
+                                },
+                            },
+                            "required": ["op", "line_number"],
+                        },
+                    },
+                },
+                "required": ["file_path", "edits"],
+            },
+        },
+    },
+]
+
+
+def _format_range(start, length):
+    """Format a hunk range the same way difflib.unified_diff does."""
+    beginning = start + 1
+    if length == 1:
+        return str(beginning)
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _diff_line(tag, line):
+    """Prefix a diff line with its tag, making sure it ends with a newline."""
+    return f"{tag}{line}" if line.endswith("\n") else f"{tag}{line}\n"
 
 
 class FileEditor:
     def __init__(self):
         """Initialize the FileEditor."""
         self.python_validator = PythonValidator() if PythonValidator else None
+        # file_path -> ((mtime_ns, size), content) of the last read or write,
+        # in least to most recently used order
+        self._content_cache = OrderedDict()
+        self._content_cache_chars = 0
+        # (file_path, content digest) -> formatted content, for content that
+        # passed validation, in least to most recently used order
+        self._validation_cache = OrderedDict()
+        # Validation results computed ahead of a batch of edits, including
+        # failures, each used by the edit that needs it
+        self._prevalidated = {}
+
+    def _read_cached(self, file_path):
+        """
+        Read a file, reusing the cached content if the file is unchanged on disk.
+
+        Args:
+            file_path (str): Path to the file to read
+
+        Returns:
+            str: File content
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        stat = os.stat(file_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._content_cache.get(file_path)
+        if cached is not None and cached[0] == key:
+            self._content_cache.move_to_end(file_path)
+            return cached[1]
+
+        with open(file_path, "r", encoding="utf-8") as file:
+            content = file.read()
+        self._cache_content(file_path, key, content)
+        return content
+
+    def _cache_content(self, file_path, key, content):
+        """
+        Remember a file's content, evicting least recently used entries.
+
+        Args:
+            file_path (str): Path of the file
+            key (tuple): (mtime_ns, size) of the file when content was current
+            content (str): File content
+        """
+        self._forget_content(file_path)
+        if len(content) > CONTENT_CACHE_MAX_CHARS:
+            return
+
+        self._content_cache[file_path] = (key, content)
+        self._content_cache_chars += len(content)
+        while (
+            len(self._content_cache) > CONTENT_CACHE_MAX_FILES
+            or self._content_cache_chars > CONTENT_CACHE_MAX_CHARS
+        ):
+            _, (_, evicted) = self._content_cache.popitem(last=False)
+            self._content_cache_chars -= len(evicted)
+
+    def _forget_content(self, file_path):
+        """
+        Drop a file from the content cache, if present.
+
+        Args:
+            file_path (str): Path of the file
+        """
+        cached = self._content_cache.pop(file_path, None)
+        if cached is not None:
+            self._content_cache_chars -= len(cached[1])
+
+    def _iter_diff(self, old_content, new_content, file_path):
+        """
+        Yield the lines of a unified diff between old and new content.
+
+        Each distinct line is mapped to a small integer first, so the matcher
+        hashes and compares ints instead of whole lines. The output is the
+        same as difflib.unified_diff.
+
+        Args:
+            old_content (str): Original file content
+            new_content (str): New file content
+            file_path (str): Path to the file (for diff header)
+
+        Yields:
+            str: Diff lines, each ending with a newline
+        """
+        old_lines = old_content.splitlines(keepends=True)
+        new_lines = new_content.splitlines(keepends=True)
+
+        line_ids = {}
+        old_ids = [line_ids.setdefault(line, len(line_ids)) for line in old_lines]
+        new_ids = [line_ids.setdefault(line, len(line_ids)) for line in new_lines]
+        matcher = difflib.SequenceMatcher(None, old_ids, new_ids)
+
+        started = False
+        for group in matcher.get_grouped_opcodes(DIFF_CONTEXT_LINES):
+            if not started:
+                started = True
+                yield f"--- a/{file_path}\n"
+                yield f"+++ b/{file_path}\n"
+
+            first, last = group[0], group[-1]
+            old_range = _format_range(first[1], last[2] - first[1])
+            new_range = _format_range(first[3], last[4] - first[3])
+            yield f"@@ -{old_range} +{new_range} @@\n"
+
+            for tag, i1, i2, j1, j2 in group:
+                if tag == "equal":
+                    for line in old_lines[i1:i2]:
+                        yield _diff_line(" ", line)
+                    continue
+                if tag in ("replace", "delete"):
+                    for line in old_lines[i1:i2]:
+                        yield _diff_line("-", line)
+                if tag in ("replace", "insert"):
+                    for line in new_lines[j1:j2]:
+                        yield _diff_line("+", line)
 
     def _generate_diff(self, old_content, new_content, file_path):
         """
@@ -25,18 +364,207 @@ class FileEditor:
         Returns:
             str: Unified diff string
         """
-        old_lines = old_content.splitlines(keepends=True)
-        new_lines = new_content.splitlines(keepends=True)
+        # Identical content has an empty diff; skip splitting and matching
+        if old_content == new_content:
+            return ""
 
-        diff = difflib.unified_diff(
-            old_lines,
-            new_lines,
-            fromfile=f"a/{file_path}",
-            tofile=f"b/{file_path}",
-            lineterm="",
-        )
+        buffer = io.StringIO()
+        for line in self._iter_diff(old_content, new_content, file_path):
+            buffer.write(line)
+        return buffer.getvalue()
+
+    def _generate_line_diff(
+        self, old_content, new_content, file_path, start, old_end, new_end
+    ):
+        """
+        Generate a unified diff for an edit whose location is already known.
+
+        old_content[start:old_end] was replaced by new_content[start:new_end] and
+        everything else is unchanged, so the single hunk is written directly
+        instead of running difflib over both files.
+
+        Args:
+            old_content (str): Original file content
+            new_content (str): New file content
+            file_path (str): Path to the file (for diff header)
+            start (int): Offset of the first changed line
+            old_end (int): End offset of the changed lines in old_content
+            new_end (int): End offset of the changed lines in new_content
+
+        Returns:
+            str: Unified diff string
+        """
+        removed = _LINE_RE.findall(old_content, start, old_end)
+        added = _LINE_RE.findall(new_content, start, new_end)
+        if removed == added:
+            return ""
+
+        # Walk back and forward over the surrounding context lines
+        context_start = start
+        for _ in range(DIFF_CONTEXT_LINES):
+            if context_start == 0:
+                break
+            context_start = old_content.rfind("\n", 0, context_start - 1) + 1
+        context_end = old_end
+        for _ in range(DIFF_CONTEXT_LINES):
+            if context_end >= len(old_content):
+                break
+            context_end = old_content.find("\n", context_end) + 1 or len(
+                old_content
+            )
+
+        before = _LINE_RE.findall(old_content, context_start, start)
+        after = _LINE_RE.findall(old_content, old_end, context_end)
+        first_line = old_content.count("\n", 0, context_start)
+        old_range = _format_range(first_line, len(before) + len(removed) + len(after))
+        new_range = _format_range(first_line, len(before) + len(added) + len(after))
+
+        hunk = [
+            f"--- a/{file_path}\n",
+            f"+++ b/{file_path}\n",
+            f"@@ -{old_range} +{new_range} @@\n",
+        ]
+        hunk.extend(_diff_line(" ", line) for line in before)
+        hunk.extend(_diff_line("-", line) for line in removed)
+        hunk.extend(_diff_line("+", line) for line in added)
+        hunk.extend(_diff_line(" ", line) for line in after)
+        return "".join(hunk)
+
+    def _line_span(self, content, line_number):
+        """
+        Locate a line by scanning for newlines instead of splitting the content.
+
+        Args:
+            content (str): File content
+            line_number (int): Line number to locate (0-indexed)
+
+        Returns:
+            tuple: (start, end) offsets of the line including its newline,
+                or None if the line does not exist
+        """
+        if line_number < 0:
+            return None
+
+        start = 0
+        for _ in range(line_number):
+            start = content.find("\n", start) + 1
+            if start == 0:
+                return None
+        if start >= len(content):
+            return None
+
+        end = content.find("\n", start) + 1
+        return start, end or len(content)
+
+    def _line_starts(self, content):
+        """
+        Find the start offset of every line in one pass.
+
+        Args:
+            content (str): File content
+
+        Returns:
+            list: Offsets where each line starts; the last entry is
+                len(content) when the content ends with a newline
+        """
+        starts = [0]
+        starts.extend(match.end() for match in _NEWLINE_RE.finditer(content))
+        return starts
+
+    def _line_offset(self, content, line_number):
+        """
+        Find where a line starts, clamping past-the-end line numbers.
+
+        Args:
+            content (str): File content
+            line_number (int): Line number to locate (0-indexed)
+
+        Returns:
+            int: Offset of the start of the line, or len(content) if the
+                content has fewer lines
+        """
+        start = 0
+        for _ in range(max(line_number, 0)):
+            start = content.find("\n", start) + 1
+            if start == 0:
+                return len(content)
+        return start
+
+    def _write_atomic(self, file_path, content):
+        """
+        Write content to a sibling temp file and rename it over the target.
 
-        return "".join(diff)
+        os.replace is atomic, so readers never see a half-written file and an
+        interrupted write leaves the previous content intact. Symlinks are
+        followed so the link itself is kept. A file with other hard links,
+        whose owner can't be given to the temp file, or whose directory
+        doesn't let us create the temp file is written in place instead.
+
+        Args:
+            file_path (str): Path of the file to write
+            content (str): Full new content of the file
+        """
+        # Replace the file a symlink points at rather than the link itself
+        target = os.path.realpath(file_path)
+        try:
+            old_stat = os.stat(target)
+        except FileNotFoundError:
+            old_stat = None
+        else:
+            # Renaming over a read-only file would succeed, so refuse it the
+            # way opening the file for writing does
+            if not os.access(target, os.W_OK):
+                raise PermissionError(
+                    errno.EACCES, os.strerror(errno.EACCES), file_path
+                )
+
+        # A rename would detach the file from its other hard links
+        in_place = old_stat is not None and old_stat.st_nlink > 1
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        try:
+            if not in_place:
+                try:
+                    file = open(tmp_path, "w", encoding="utf-8")
+                except FileNotFoundError:
+                    # Create directories if they don't exist, then try again
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    file = open(tmp_path, "w", encoding="utf-8")
+                except PermissionError:
+                    # The file may be writable in a directory where we can't
+                    # create files, so write it in place instead
+                    if old_stat is None:
+                        raise
+                    in_place = True
+            if not in_place:
+                with file:
+                    file.write(content)
+                if old_stat is not None:
+                    shutil.copymode(target, tmp_path)  # Keep existing permissions
+                    owner = (old_stat.st_uid, old_stat.st_gid)
+                    tmp_stat = os.stat(tmp_path)
+                    if (tmp_stat.st_uid, tmp_stat.st_gid) != owner:
+                        try:
+                            os.chown(tmp_path, *owner)
+                        except OSError:
+                            in_place = True  # Can't keep the owner
+                if in_place:
+                    os.remove(tmp_path)
+                else:
+                    os.replace(tmp_path, target)
+            if in_place:
+                with open(target, "w", encoding="utf-8") as file:
+                    file.write(content)
+        except BaseException:
+            self._forget_content(file_path)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        # Remember what we wrote so the next edit doesn't have to re-read it
+        stat = os.stat(file_path)
+        self._cache_content(file_path, (stat.st_mtime_ns, stat.st_size), content)
 
     def _validate_and_format_python_content(self, content, file_path):
         """
@@ -52,21 +580,62 @@ class FileEditor:
         if not file_path.endswith('.py'):
             return content, True, ""  # Not Python, skip validation
             
-        if not has_ruff():
-            return content, True, ""  # Ruff not available, skip validation
-            
         if not self.python_validator:
             return content, True, ""  # No validator, skip
+
+        # Availability is probed once when the validator is created
+        if not self.python_validator.available:
+            return content, True, ""  # Ruff not available, skip validation
             
+        # Content already validated for this path is formatted the same way
+        # again, so reuse the result instead of running ruff. The path is part
+        # of the key because ruff picks its configuration from it.
+        key = self._validation_key(content, file_path)
+        result = self._prevalidated.pop(key, None)
+        if result is None:
+            cached = self._validation_cache.get(key)
+            if cached is not None:
+                self._validation_cache.move_to_end(key)
+                return cached, True, ""
+            result = self._run_python_validator(content, file_path)
+
+        validated_content, success, _ = result
+        if success:
+            # Only successes are cached, so errors are always reported fresh
+            self._validation_cache[key] = validated_content
+            if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        return result
+
+    def _validation_key(self, content, file_path):
+        """Key validation results by path and a digest of the content."""
+        return (
+            file_path,
+            hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest(),
+        )
+
+    def _run_python_validator(self, content, file_path):
+        """
+        Run the Python validator without touching any editor state.
+
+        Safe to call from worker threads.
+
+        Args:
+            content (str): Content to validate and format
+            file_path (str): Path of the file
+
+        Returns:
+            tuple: (new_content, success_bool, error_message)
+        """
         try:
-            validated_content, success, error_msg = self.python_validator.validate_and_format_python(content)
+            validated_content, success, error_msg = self.python_validator.validate_and_format_python(content, file_path)
             if not success:
                 return content, False, f"Python validation failed: {error_msg}"
             return validated_content, success, ""
         except Exception as e:
             return content, False, f"Python validation error: {str(e)}"
 
-    def edit_file(self, file_path, content, mode="w"):
+    def edit_file(self, file_path, content, mode="w", include_diff=False):
         """
         Edit a file at the specified path by writing content to it.
         If it's a Python file and ruff is available, content is validated and formatted.
@@ -75,22 +644,38 @@ class FileEditor:
             file_path (str): Relative path to the file to edit
             content (str): Content to write to the file
             mode (str): File opening mode ('w' for overwrite, 'a' for append)
+            include_diff (bool): Whether to generate the diff; when False the
+                'diff' value is an empty string
 
         Returns:
             dict: Dictionary with 'message', 'diff', and 'success' keys
         """
         try:
             # Read old content if file exists
-            old_content = ""
-            if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as file:
-                    old_content = file.read()
+            try:
+                old_content = self._read_cached(file_path)
+                file_exists = True
+            except FileNotFoundError:
+                old_content = ""
+                file_exists = False
+
+            # Rewriting the current content or appending nothing is a no-op,
+            # so skip validation, the write and the diff
+            unchanged = not content if mode == "a" else content == old_content
+            if file_exists and unchanged:
+                return {
+                    "message": f"No changes made to {file_path}",
+                    "diff": "",
+                    "success": True,
+                }
 
             # Determine new content based on mode
-            if mode == "a" and old_content:
+            appending = mode == "a" and bool(old_content)
+            if appending:
                 new_content = old_content + content
             else:
                 new_content = content
+            appended_content = new_content
 
             # If it's a .py file, validate with ruff before writing
             if file_path.endswith('.py'):
@@ -103,28 +688,32 @@ class FileEditor:
                         "success": False,
                     }
 
-            # Create directories if they don't exist
-            dir_path = os.path.dirname(file_path)
-            if dir_path:
-                os.makedirs(dir_path, exist_ok=True)
+            # Leave the file (and its mtime) alone if nothing changed
+            if file_exists and new_content == old_content:
+                return {
+                    "message": f"No changes made to {file_path}",
+                    "diff": "",
+                    "success": True,
+                }
 
             # Write the potentially validated+formatted file
-            with open(file_path, mode, encoding="utf-8") as file:
-                if mode == 'w':
-                    file.write(new_content)
-
-            # For files that were originally just appended to, we need the correct final content 
-            final_new_content = new_content  
-            if mode == 'a':
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    final_new_content = file.read()
+            self._write_atomic(file_path, new_content)
 
-            # Generate diff if needed
-            current_new_content = ""
-            with open(file_path, "r", encoding="utf-8") as file:
-                current_new_content = file.read()
-
-            diff = self._generate_diff(old_content, current_new_content, file_path)
+            # Diff against the content we just wrote rather than reading it back
+            if not include_diff:
+                diff = ""
+            elif appending and new_content == appended_content:
+                # Only the tail changed, so diff from the start of the old last line
+                diff = self._generate_line_diff(
+                    old_content,
+                    new_content,
+                    file_path,
+                    old_content.rfind("\n") + 1,
+                    len(old_content),
+                    len(new_content),
+                )
+            else:
+                diff = self._generate_diff(old_content, new_content, file_path)
 
             return {
                 "message": f"Successfully edited {file_path}",
@@ -138,10 +727,150 @@ class FileEditor:
                 "success": False,
             }
 
+    def edit_files_batch(self, edits, include_diff=False):
+        """
+        Apply several edit_file calls in one go.
+
+        Lets callers write many files with a single tool call instead of one
+        round-trip per file. Each edit succeeds or fails on its own.
+
+        Args:
+            edits (list): Dictionaries with 'file_path', 'content' and an
+                optional 'mode' key, as accepted by edit_file
+            include_diff (bool): Whether to generate a diff for each file
+
+        Returns:
+            list: One edit_file result dictionary per edit, in order, or just
+                an error dictionary if edits isn't a list
+        """
+        if not isinstance(edits, (list, tuple)):
+            return [
+                {
+                    "message": "Error: 'edits' must be a list of edits",
+                    "diff": "",
+                    "success": False,
+                }
+            ]
+
+        self._prevalidate_python(edits)
+
+        results = []
+        try:
+            for edit in edits:
+                if not (
+                    isinstance(edit, dict)
+                    and isinstance(edit.get("file_path"), str)
+                    and isinstance(edit.get("content"), str)
+                ):
+                    results.append(
+                        {
+                            "message": "Error: Each edit needs 'file_path' and 'content'",
+                            "diff": "",
+                            "success": False,
+                        }
+                    )
+                    continue
+                results.append(
+                    self.edit_file(
+                        edit["file_path"],
+                        edit["content"],
+                        mode=edit.get("mode", "w"),
+                        include_diff=include_diff,
+                    )
+                )
+        finally:
+            # Results for edits that never got as far as validating are stale
+            # once the batch is done
+            self._prevalidated.clear()
+        return results
+
+    def _prevalidate_python(self, edits):
+        """
+        Validate the Python files of a batch in parallel ahead of the edits.
+
+        Each validation mostly waits on a ruff subprocess, so they are run
+        from a thread pool. The workers only return their results; they are
+        stored from this thread for the edits themselves to pick up, failures
+        included, so no file goes through ruff twice. Appends are skipped
+        because their content depends on the file, as is content that is
+        already in the file or the validation cache.
+
+        Args:
+            edits (list): Edits as accepted by edit_files_batch
+        """
+        if not (self.python_validator and self.python_validator.available):
+            return
+
+        jobs = {}
+        for edit in edits:
+            if not (
+                isinstance(edit, dict)
+                and isinstance(edit.get("file_path"), str)
+                and isinstance(edit.get("content"), str)
+                and edit["file_path"].endswith(".py")
+                and edit.get("mode", "w") != "a"
+            ):
+                continue
+            file_path, content = edit["file_path"], edit["content"]
+            key = self._validation_key(content, file_path)
+            if key in jobs or key in self._validation_cache:
+                continue
+            if self._is_cached_content(file_path, content):
+                continue  # edit_file skips unchanged files without validating
+            jobs[key] = (content, file_path)
+        if len(jobs) < 2:
+            return
+
+        workers = min(VALIDATION_WORKERS, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(self._run_python_validator, *job)
+                for key, job in jobs.items()
+            }
+            for key, future in futures.items():
+                self._prevalidated[key] = future.result()
+
+    def _is_cached_content(self, file_path, content):
+        """
+        Check whether content matches the cached, still current, file content.
+
+        Only the cache is consulted, so this costs at most a stat call.
+
+        Args:
+            file_path (str): Path of the file
+            content (str): Content to compare
+
+        Returns:
+            bool: True if the file is known to hold exactly this content
+        """
+        cached = self._content_cache.get(file_path)
+        if cached is None or cached[1] != content:
+            return False
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return cached[0] == (stat.st_mtime_ns, stat.st_size)
+
     def read_file(self, file_path):
         """
         Read content from a file at the specified path.
 
+        Args:
+            file_path (str): Relative path to the file to read
+
+        Returns:
+            str: File content
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        return self._read_cached(file_path)
+
+    def read_file_safe(self, file_path):
+        """
+        Read content from a file, reporting failures in the returned string.
+
         Args:
             file_path (str): Relative path to the file to read
 
@@ -149,8 +878,7 @@ class FileEditor:
             str: File content or error message
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                return file.read()
+            return self.read_file(file_path)
         except Exception as e:
             return f"Error reading file: {str(e)}"
 
@@ -167,7 +895,7 @@ class FileEditor:
         """
         return self.edit_file(file_path, content, mode="a")
 
-    def insert_line(self, file_path, line_number, content):
+    def insert_line(self, file_path, line_number, content, include_diff=False):
         """
         Insert a line into a file at the specified line number.
         If it's a Python file and ruff is available, validates with ruff before writing.
@@ -176,6 +904,8 @@ class FileEditor:
             file_path (str): Relative path to the file
             line_number (int): Line number where to insert (0-indexed)
             content (str): Content to insert
+            include_diff (bool): Whether to generate the diff; when False the
+                'diff' value is an empty string
 
         Returns:
             dict: Dictionary with 'message', 'diff', and 'success' keys
@@ -183,20 +913,19 @@ class FileEditor:
         try:
             # Read all lines from the file
             old_content = self.read_file(file_path)
-            if old_content.startswith("Error"):
-                return {"message": old_content, "diff": "", "success": False}
-
-            lines = old_content.splitlines(keepends=True)
 
-            # Ensure line_number is valid
-            if line_number < 0:
-                line_number = 0
-            elif line_number > len(lines):
-                line_number = len(lines)
-
-            # Insert the line
-            lines.insert(line_number, content + "\n")
-            new_content = "".join(lines)
+            # Out of range line numbers insert at the start or end of the file
+            start = self._line_offset(old_content, line_number)
+            line_number = max(0, min(line_number, old_content.count("\n", 0, start)))
+            old_end = start
+            inserted = content if content.endswith("\n") else content + "\n"
+            if old_content and start == len(old_content) and old_content[-1] != "\n":
+                # Terminate the last line first, so the diff covers it too
+                start = old_content.rfind("\n") + 1
+                line_number += 1
+                inserted = old_content[start:] + "\n" + inserted
+            spliced_content = old_content[:start] + inserted + old_content[old_end:]
+            new_content = spliced_content
 
             # If it's a Python file, validate with ruff before writing
             if file_path.endswith('.py'):
@@ -209,12 +938,32 @@ class FileEditor:
                         "success": False,
                     }
 
+            # Leave the file (and its mtime) alone if nothing changed
+            if new_content == old_content:
+                return {
+                    "message": f"No changes made to {file_path}",
+                    "diff": "",
+                    "success": True,
+                }
+
             # Write back to file
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write(new_content)
+            self._write_atomic(file_path, new_content)
 
-            # Generate diff
-            diff = self._generate_diff(old_content, new_content, file_path)
+            # Generate diff, emitting the hunk directly unless the formatter
+            # touched lines outside the one we inserted
+            if not include_diff:
+                diff = ""
+            elif new_content == spliced_content:
+                diff = self._generate_line_diff(
+                    old_content,
+                    new_content,
+                    file_path,
+                    start,
+                    old_end,
+                    start + len(inserted),
+                )
+            else:
+                diff = self._generate_diff(old_content, new_content, file_path)
 
             return {
                 "message": f"Successfully inserted line at {line_number} in {file_path}",
@@ -228,7 +977,7 @@ class FileEditor:
                 "success": False,
             }
 
-    def remove_line(self, file_path, line_number):
+    def remove_line(self, file_path, line_number, include_diff=False):
         """
         Remove a line from a file at the specified line number.
         If it's a Python file and ruff is available, validates with ruff before writing.
@@ -236,6 +985,8 @@ class FileEditor:
         Args:
             file_path (str): Relative path to the file
             line_number (int): Line number to remove (0-indexed)
+            include_diff (bool): Whether to generate the diff; when False the
+                'diff' value is an empty string
 
         Returns:
             dict: Dictionary with 'message', 'diff', and 'success' keys
@@ -243,22 +994,20 @@ class FileEditor:
         try:
             # Read all lines from the file
             old_content = self.read_file(file_path)
-            if old_content.startswith("Error"):
-                return {"message": old_content, "diff": "", "success": False}
-
-            lines = old_content.splitlines(keepends=True)
 
             # Check if line_number is valid
-            if line_number < 0 or line_number >= len(lines):
+            span = self._line_span(old_content, line_number)
+            if span is None:
                 return {
                     "message": f"Error: Line number {line_number} is out of range",
                     "diff": "",
                     "success": False,
                 }
 
-            # Remove the line
-            lines.pop(line_number)
-            new_content = "".join(lines)
+            # Remove the line by splicing around it
+            start, end = span
+            spliced_content = old_content[:start] + old_content[end:]
+            new_content = spliced_content
 
             # If it's a Python file, validate with ruff before writing
             if file_path.endswith('.py'):
@@ -271,12 +1020,27 @@ class FileEditor:
                         "success": False,
                     }
 
+            # Leave the file (and its mtime) alone if nothing changed
+            if new_content == old_content:
+                return {
+                    "message": f"No changes made to {file_path}",
+                    "diff": "",
+                    "success": True,
+                }
+
             # Write back to file
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write(new_content)
+            self._write_atomic(file_path, new_content)
 
-            # Generate diff
-            diff = self._generate_diff(old_content, new_content, file_path)
+            # Generate diff, emitting the hunk directly unless the formatter
+            # touched other lines
+            if not include_diff:
+                diff = ""
+            elif new_content == spliced_content:
+                diff = self._generate_line_diff(
+                    old_content, new_content, file_path, start, end, start
+                )
+            else:
+                diff = self._generate_diff(old_content, new_content, file_path)
 
             return {
                 "message": f"Successfully removed line {line_number} from {file_path}",
@@ -290,7 +1054,9 @@ class FileEditor:
                 "success": False,
             }
 
-    def change_line(self, file_path, line_number, new_content_line):
+    def change_line(
+        self, file_path, line_number, new_content_line, include_diff=False
+    ):
         """
         Change the content of a specific line in a file.
         If it's a Python file and ruff is available, validates with ruff before writing.
@@ -299,6 +1065,8 @@ class FileEditor:
             file_path (str): Relative path to the file
             line_number (int): Line number to change (0-indexed)
             new_content_line (str): New content for the line
+            include_diff (bool): Whether to generate the diff; when False the
+                'diff' value is an empty string
 
         Returns:
             dict: Dictionary with 'message', 'diff', and 'success' keys
@@ -306,22 +1074,25 @@ class FileEditor:
         try:
             # Read all lines from the file
             old_content = self.read_file(file_path)
-            if old_content.startswith("Error"):
-                return {"message": old_content, "diff": "", "success": False}
-
-            lines = old_content.splitlines(keepends=True)
 
             # Check if line_number is valid
-            if line_number < 0 or line_number >= len(lines):
+            span = self._line_span(old_content, line_number)
+            if span is None:
                 return {
                     "message": f"Error: Line number {line_number} is out of range",
                     "diff": "",
                     "success": False,
                 }
 
-            # Change the line
-            lines[line_number] = new_content_line + "\n"
-            new_content_full = "".join(lines)
+            # Change the line by splicing around it
+            start, end = span
+            replacement = (
+                new_content_line
+                if new_content_line.endswith("\n")
+                else new_content_line + "\n"
+            )
+            spliced_content = old_content[:start] + replacement + old_content[end:]
+            new_content_full = spliced_content
 
             # If it's a Python file, validate with ruff before writing
             if file_path.endswith('.py'):
@@ -334,12 +1105,32 @@ class FileEditor:
                         "success": False,
                     }
 
+            # Leave the file (and its mtime) alone if nothing changed
+            if new_content_full == old_content:
+                return {
+                    "message": f"No changes made to {file_path}",
+                    "diff": "",
+                    "success": True,
+                }
+
             # Write back to file
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write(new_content_full)
+            self._write_atomic(file_path, new_content_full)
 
-            # Generate diff
-            diff = self._generate_diff(old_content, new_content_full, file_path)
+            # Generate diff, emitting the hunk directly unless the formatter
+            # touched lines outside the one we changed
+            if not include_diff:
+                diff = ""
+            elif new_content_full == spliced_content:
+                diff = self._generate_line_diff(
+                    old_content,
+                    new_content_full,
+                    file_path,
+                    start,
+                    end,
+                    start + len(replacement),
+                )
+            else:
+                diff = self._generate_diff(old_content, new_content_full, file_path)
 
             return {
                 "message": f"Successfully changed line {line_number} in {file_path}",
@@ -353,6 +1144,170 @@ class FileEditor:
                 "success": False,
             }
 
+    def _resolve_line_edits(self, content, edits):
+        """
+        Build the result of several line edits in one pass over the content.
+
+        Every edit is resolved against the original line offsets, then the
+        output is assembled once from the untouched stretches between edited
+        lines. On each line the inserts come first, in the order given,
+        followed by at most one remove or change of the line itself.
+
+        Args:
+            content (str): Original file content
+            edits (list): Edits as accepted by apply_edits
+
+        Returns:
+            str: The edited content
+
+        Raises:
+            ValueError: If an edit is malformed, out of range, or removes or
+                changes a line that another edit already removes or changes
+        """
+        line_starts = self._line_starts(content)
+        # A final line without a newline has no entry after it in line_starts
+        if content and not content.endswith("\n"):
+            n_lines = len(line_starts)
+        else:
+            n_lines = len(line_starts) - 1
+
+        inserts = []
+        replacements = {}
+        for index, edit in enumerate(edits):
+            if not isinstance(edit, dict):
+                raise ValueError(f"Edit {index} is not an object")
+            op = edit.get("op")
+            if op not in ("insert", "remove", "change"):
+                raise ValueError(f"Unknown edit operation '{op}'")
+            line_number = edit.get("line_number")
+            if not isinstance(line_number, int) or isinstance(line_number, bool):
+                raise ValueError(f"Edit {index} needs an integer 'line_number'")
+            text = ""
+            if op != "remove":
+                text = edit.get("content")
+                if not isinstance(text, str):
+                    raise ValueError(f"Edit {index} needs a string 'content'")
+                if not text.endswith("\n"):
+                    text += "\n"
+
+            if op == "insert":
+                inserts.append((line_number, index, text))
+                continue
+            if not 0 <= line_number < n_lines:
+                raise ValueError(f"Line number {line_number} is out of range")
+            if line_number in replacements:
+                raise ValueError(
+                    f"Line number {line_number} is removed or changed more than once"
+                )
+            replacements[line_number] = text
+
+        # Out of range inserts go at the start or end of the file, in line
+        # number order and then in the order given
+        inserts.sort(key=lambda insert: insert[:2])
+        inserts_at = {}
+        for line_number, _, text in inserts:
+            position = min(max(line_number, 0), n_lines)
+            inserts_at.setdefault(position, []).append(text)
+
+        parts = []
+        pos = 0
+        for line_number in sorted(inserts_at.keys() | replacements.keys()):
+            start = line_starts[line_number] if line_number < n_lines else len(content)
+            parts.append(content[pos:start])
+            pos = start
+            if (
+                line_number == n_lines
+                and start
+                and content[-1] != "\n"
+                and n_lines - 1 not in replacements
+            ):
+                # Terminate the old last line before adding lines after it
+                parts.append("\n")
+            parts.extend(inserts_at.get(line_number, ()))
+            if line_number in replacements:
+                parts.append(replacements[line_number])
+                if line_number + 1 < len(line_starts):
+                    pos = line_starts[line_number + 1]
+                else:
+                    pos = len(content)
+        parts.append(content[pos:])
+        return "".join(parts)
+
+    def apply_edits(self, file_path, edits, include_diff=False):
+        """
+        Apply several line edits to a file with a single read and write.
+
+        Line numbers refer to the file before any of the edits are applied.
+        Inserts on a line go before it in the order given, and a line can be
+        removed or changed by at most one edit. If any edit is invalid the
+        file is left untouched.
+        If it's a Python file and ruff is available, validates with ruff before writing.
+
+        Args:
+            file_path (str): Relative path to the file
+            edits (list): Dictionaries with an 'op' ('insert', 'remove' or
+                'change'), a 'line_number' (0-indexed) and, for inserts and
+                changes, the line 'content'
+            include_diff (bool): Whether to generate the diff; when False the
+                'diff' value is an empty string
+
+        Returns:
+            dict: Dictionary with 'message', 'diff', and 'success' keys
+        """
+        try:
+            # Read the file once for all of the edits
+            old_content = self.read_file(file_path)
+
+            try:
+                new_content = self._resolve_line_edits(old_content, edits)
+            except ValueError as e:
+                return {
+                    "message": f"Error: {e}",
+                    "diff": "",
+                    "success": False,
+                }
+
+            # If it's a Python file, validate with ruff before writing
+            if file_path.endswith(".py"):
+                new_content, validation_success, validation_error = (
+                    self._validate_and_format_python_content(new_content, file_path)
+                )
+
+                if not validation_success:
+                    return {
+                        "message": validation_error,
+                        "diff": "",
+                        "success": False,
+                    }
+
+            # Leave the file (and its mtime) alone if nothing changed
+            if new_content == old_content:
+                return {
+                    "message": f"No changes made to {file_path}",
+                    "diff": "",
+                    "success": True,
+                }
+
+            # Write back to file
+            self._write_atomic(file_path, new_content)
+
+            if include_diff:
+                diff = self._generate_diff(old_content, new_content, file_path)
+            else:
+                diff = ""
+
+            return {
+                "message": f"Successfully applied {len(edits)} edits to {file_path}",
+                "diff": diff,
+                "success": True,
+            }
+        except Exception as e:
+            return {
+                "message": f"Error applying edits: {str(e)}",
+                "diff": "",
+                "success": False,
+            }
+
     def get_tools(self):
         """
         Expose available tools for the AI agent.
@@ -360,106 +1315,4 @@ class FileEditor:
         Returns:
             dict: Dictionary with tool definitions
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "edit_file",
-                    "description": "Edit a file at the specified path by writing content to it",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Relative path to the file to edit",
-                            },
-                            "content": {
-                                "type": "string",
-                                "description": "Content to write to the file",
-                            },
-                            "mode": {
-                                "type": "string",
-                                "description": "File opening mode ('w' for overwrite, 'a' for append)",
-                                "default": "w",
-                            },
-                        },
-                        "required": ["file_path", "content"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "insert_line",
-                    "description": "Insert a line into a file at the specified line number",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Relative path to the file",
-                            },
-                            "line_number": {
-                                "type": "integer",
-                                "description": "Line number where to insert (0-indexed)",
-                            },
-                            "content": {
-                                "type": "string",
-                                "description": "Content to insert",
-                            },
-                        },
-                        "required": ["file_path", "line_number", "content"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "remove_line",
-                    "description": "Remove a line from a file at the specified line number",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Relative path to the file",
-                            },
-                            "line_number": {
-                                "type": "integer",
-                                "description": "Line number to remove (0-indexed)",
-                            },
-                        },
-                        "required": ["file_path", "line_number"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "change_line",
-                    "description": "Change the content of a specific line in a file",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "file_path": {
-                                "type": "string",
-                                "description": "Relative path to the file",
-                            },
-                            "line_number": {
-                                "type": "integer",
-                                "description": "Line number to change (0-indexed)",
-                            },
-                            "new_content": {
-                                "type": "string",
-                                "description": "New content for the line",
-                            },
-                        },
-                        "required": [
-                            "file_path",
-                            "line_number",
-                            "new_content",
-                        ],
-                    },
-                },
-            },
-        ]
\ No newline at end of file
+        return _TOOLS
@@ -1,3 +1,23 @@
+import re
+
+# Pattern to match @filename references, compiled once at import
+_FILE_REFERENCE_RE = re.compile(r"@([^\s]+)")
+
+# Tool schemas returned by get_tools, built once at import
+_TOOLS = [
+    {
+        "name": "insert_file_content",
+        "description": "Replace @file_path references with file contents formatted with backticks and filename",
+        "parameters": {
+            "user_input": {
+                "type": "string",
+                "description": "Input string containing @file_path references to be replaced with file contents",
+            }
+        },
+    }
+]
+
+
 class FileInserter:
     def __init__(self, file_reader):
         """
@@ -19,8 +39,6 @@ class FileInserter:
         Returns:
             str: Processed string with file contents inserted
         """
-        import re
-
         def replace_file_reference(match):
             file_path = match.group(1)
             file_content = self.file_reader.read_file(file_path)
@@ -32,9 +50,7 @@ class FileInserter:
             # Format the content with filename label, backticks, and filename at the end
             return f"{file_path}\n```\n{file_content}\n```\n{file_path}"
 
-        # Pattern to match @filename
-        pattern = r"@([^\s]+)"
-        result = re.sub(pattern, replace_file_reference, user_input)
+        result = _FILE_REFERENCE_RE.sub(replace_file_reference, user_input)
         return result
 
     def get_tools(self):
@@ -44,15 +60,4 @@ class FileInserter:
         Returns:
             list: List of tool dictionaries with name, description, and function.
         """
-        return [
-            {
-                "name": "insert_file_content",
-                "description": "Replace @file_path references with file contents formatted with backticks and filename",
-                "parameters": {
-                    "user_input": {
-                        "type": "string",
-                        "description": "Input string containing @file_path references to be replaced with file contents",
-                    }
-                },
-            }
-        ]
+        return _TOOLS
@@ -1,5 +1,39 @@
 import os
 
+# Tool schema returned by get_tools, built once at import
+_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "list_files",
+        "description": "List files and directories at the specified path. Can filter by pattern and list recursively.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": "Directory path to list (default: current directory '.')",
+                    "default": ".",
+                },
+                "pattern": {
+                    "type": "string",
+                    "description": "Optional pattern to filter files (e.g., '*.py', '*.txt', 'test_*'). Use wildcards (*) to match multiple characters.",
+                },
+                "recursive": {
+                    "type": "boolean",
+                    "description": "Whether to list files recursively in subdirectories",
+                    "default": False,
+                },
+                "show_hidden": {
+                    "type": "boolean",
+                    "description": "Whether to show hidden files (starting with .)",
+                    "default": False,
+                },
+            },
+            "required": [],
+        },
+    },
+}
+
 
 class FileLister:
     def __init__(self):
@@ -140,38 +174,7 @@ class FileLister:
         Returns:
             dict: Dictionary with tool definitions
         """
-        return {
-            "type": "function",
-            "function": {
-                "name": "list_files",
-                "description": "List files and directories at the specified path. Can filter by pattern and list recursively.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "directory": {
-                            "type": "string",
-                            "description": "Directory path to list (default: current directory '.')",
-                            "default": ".",
-                        },
-                        "pattern": {
-                            "type": "string",
-                            "description": "Optional pattern to filter files (e.g., '*.py', '*.txt', 'test_*'). Use wildcards (*) to match multiple characters.",
-                        },
-                        "recursive": {
-                            "type": "boolean",
-                            "description": "Whether to list files recursively in subdirectories",
-                            "default": False,
-                        },
-                        "show_hidden": {
-                            "type": "boolean",
-                            "description": "Whether to show hidden files (starting with .)",
-                            "default": False,
-                        },
-                    },
-                    "required": [],
-                },
-            },
-        }
+        return _TOOL
 
 
 # Example usage
@@ -18,7 +18,7 @@ class MergeConflictType(Enum):
     ADDITION_CONFLICT = "addition_conflict"
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeConflict:
     """Represents a merge conflict."""
 
@@ -30,7 +30,7 @@ class MergeConflict:
     resolution: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeResult:
     """Result of a three-way merge."""
 
@@ -1,14 +1,55 @@
+from itertools import islice
+
+# Tool schema returned by get_tools, built once at import
+_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "read_file",
+        "description": "Read and return the contents of a file",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to read",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Number of lines to skip from the start of the file (0-indexed line to start at)",
+                    "minimum": 0,
+                    "default": 0,
+                },
+                "length": {
+                    "type": "integer",
+                    "description": "Maximum number of lines to read. Omit to read to the end of the file.",
+                    "minimum": 0,
+                },
+            },
+            "required": ["file_path"],
+        },
+    },
+}
+
+
+def _is_line_count(value):
+    """Check that a value is a usable, non-negative number of lines."""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
 class FileReader:
     def __init__(self, file_path=None):
         """Initialize the FileReader with an optional file path."""
         self.file_path = file_path
 
-    def read_file(self, file_path=None):
+    def read_file(self, file_path=None, offset=0, length=None):
         """
         Read and return the contents of a file.
 
         Args:
             file_path (str): Path to the file to read. If None, uses initialized path.
+            offset (int): Number of lines to skip from the start of the file
+            length (int): Maximum number of lines to return. If None, reads to
+                the end of the file.
 
         Returns:
             str: Contents of the file or error message.
@@ -17,9 +58,22 @@ class FileReader:
         if not path:
             return "Error: No file path provided"
 
+        # Tool calls can carry anything, and islice only takes counts >= 0
+        if offset is None:
+            offset = 0
+        if not _is_line_count(offset):
+            return "Error: 'offset' must be a non-negative integer"
+        if length is not None and not _is_line_count(length):
+            return "Error: 'length' must be a non-negative integer"
+
         try:
             with open(path, "r", encoding="utf-8") as file:
-                return file.read()
+                if not offset and length is None:
+                    return file.read()
+                # Stream past the skipped lines and stop after the last one
+                # wanted, rather than reading the whole file
+                stop = None if length is None else offset + length
+                return "".join(islice(file, offset, stop))
         except FileNotFoundError:
             return f"Error: File '{path}' not found"
         except Exception as e:
@@ -32,20 +86,4 @@ class FileReader:
         Returns:
             dict: Tool dictionary with proper schema format.
         """
-        return {
-            "type": "function",
-            "function": {
-                "name": "read_file",
-                "description": "Read and return the contents of a file",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to read",
-                        }
-                    },
-                    "required": ["file_path"],
-                },
-            },
-        }
+        return _TOOL
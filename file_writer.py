@@ -1,10 +1,37 @@
 import os
 
 try:
-    from python_validator import PythonValidator, has_ruff  # Try to import PythonValidator
+    from python_validator import PythonValidator  # Try to import PythonValidator
 except ImportError:
     PythonValidator = None
-    has_ruff = lambda: False  # Define as a function that always returns False
+
+# Tool schema returned by get_tools, built once at import
+_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "write_file",
+        "description": "Write content to a file at the specified path",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Relative path to the file to write",
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Content to write to the file",
+                },
+                "mode": {
+                    "type": "string",
+                    "description": "File opening mode ('w' for overwrite, 'a' for append)",
+                    "default": "w",
+                },
+            },
+            "required": ["file_path", "content"],
+        },
+    },
+}
 
 
 class FileWriter:
@@ -26,14 +53,15 @@ class FileWriter:
         if not file_path.endswith('.py'):
             return content, True, ""  # Not Python, skip validation
             
-        if not has_ruff():
-            return content, True, ""  # Ruff not available, skip validation
-            
         if not self.python_validator:
             return content, True, ""  # No validator, skip
+
+        # Availability is probed once when the validator is created
+        if not self.python_validator.available:
+            return content, True, ""  # Ruff not available, skip validation
             
         try:
-            validated_content, success, error_msg = self.python_validator.validate_and_format_python(content)
+            validated_content, success, error_msg = self.python_validator.validate_and_format_python(content, file_path)
             if not success:
                 return content, False, f"Python validation failed: {error_msg}"
             return validated_content, success, ""
@@ -64,12 +92,17 @@ class FileWriter:
                 # Use the validated and formatted content instead of the original
                 content = new_content
 
-            # Create directories if they don't exist
-            dir_path = os.path.dirname(file_path)
-            if dir_path:
+            try:
+                file = open(file_path, mode, encoding="utf-8")
+            except FileNotFoundError:
+                # Create directories if they don't exist, then try again
+                dir_path = os.path.dirname(file_path)
+                if not dir_path:
+                    raise
                 os.makedirs(dir_path, exist_ok=True)
+                file = open(file_path, mode, encoding="utf-8")
 
-            with open(file_path, mode, encoding="utf-8") as file:
+            with file:
                 file.write(content)
             return f"Successfully wrote to {file_path}"
         except Exception as e:
@@ -82,29 +115,4 @@ class FileWriter:
         Returns:
             list: List of tool dictionaries with name, description, and function.
         """
-        return {
-            "type": "function",
-            "function": {
-                "name": "write_file",
-                "description": "Write content to a file at the specified path",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Relative path to the file to write",
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Content to write to the file",
-                        },
-                        "mode": {
-                            "type": "string",
-                            "description": "File opening mode ('w' for overwrite, 'a' for append)",
-                            "default": "w",
-                        },
-                    },
-                    "required": ["file_path", "content"],
-                },
-            },
-        }
\ No newline at end of file
+        return _TOOL
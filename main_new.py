@@ -200,7 +200,7 @@ class AIAssistant:
             result = self.file_writer.write_file(**args)
             self.ui.show_tool_result(result)
         elif tool_call.function.name == "edit_file":
-            result = self.file_editor.edit_file(**args)
+            result = self.file_editor.edit_file(**args, include_diff=True)
             # Handle dict result with diff
             if isinstance(result, dict):
                 self.ui.show_tool_result(result.get("message", "Operation completed"))
@@ -209,8 +209,15 @@ class AIAssistant:
                 result = result.get("message", "Operation completed")
             else:
                 self.ui.show_tool_result(result)
+        elif tool_call.function.name == "edit_files_batch":
+            results = self.file_editor.edit_files_batch(**args, include_diff=True)
+            for item in results:
+                self.ui.show_tool_result(item["message"])
+                if item["diff"]:
+                    self.ui.show_diff(item["diff"], max_lines=10)
+            result = "\n".join(item["message"] for item in results)
         elif tool_call.function.name == "insert_line":
-            result = self.file_editor.insert_line(**args)
+            result = self.file_editor.insert_line(**args, include_diff=True)
             # Handle dict result with diff
             if isinstance(result, dict):
                 self.ui.show_tool_result(result.get("message", "Operation completed"))
@@ -220,7 +227,7 @@ class AIAssistant:
             else:
                 self.ui.show_tool_result(result)
         elif tool_call.function.name == "remove_line":
-            result = self.file_editor.remove_line(**args)
+            result = self.file_editor.remove_line(**args, include_diff=True)
             # Handle dict result with diff
             if isinstance(result, dict):
                 self.ui.show_tool_result(result.get("message", "Operation completed"))
@@ -230,7 +237,7 @@ class AIAssistant:
             else:
                 self.ui.show_tool_result(result)
         elif tool_call.function.name == "change_line":
-            result = self.file_editor.change_line(**args)
+            result = self.file_editor.change_line(**args, include_diff=True)
             # Handle dict result with diff
             if isinstance(result, dict):
                 self.ui.show_tool_result(result.get("message", "Operation completed"))
@@ -239,9 +246,18 @@ class AIAssistant:
                 result = result.get("message", "Operation completed")
             else:
                 self.ui.show_tool_result(result)
+        elif tool_call.function.name == "apply_edits":
+            result = self.file_editor.apply_edits(**args, include_diff=True)
+            self.ui.show_tool_result(result["message"])
+            if result["diff"]:
+                self.ui.show_diff(result["diff"], max_lines=10)
+            result = result["message"]
         elif tool_call.function.name == "delete_file":
             result = self.file_deleter.delete_file(**args)
             self.ui.show_tool_result(result)
+        elif tool_call.function.name == "delete_files":
+            result = self.file_deleter.delete_files(**args)
+            self.ui.show_tool_result(result)
         elif tool_call.function.name == "delete_directory":
             result = self.file_deleter.delete_directory(**args)
             self.ui.show_tool_result(result)
@@ -286,18 +302,20 @@ class AIAssistant:
                     )
 
                 # Execute all tool calls (thinking indicator is OFF during tool execution)
+                # and render their panels together once the batch completes
                 tool_results = []
-                for tool_call in ai_message.tool_calls:
-                    result = self.execute_tool_call(tool_call)
-
-                    tool_results.append(
-                        {
-                            "tool_call_id": tool_call.id,
-                            "role": "tool",
-                            "name": tool_call.function.name,
-                            "content": result,
-                        }
-                    )
+                with self.ui.batch():
+                    for tool_call in ai_message.tool_calls:
+                        result = self.execute_tool_call(tool_call)
+
+                        tool_results.append(
+                            {
+                                "tool_call_id": tool_call.id,
+                                "role": "tool",
+                                "name": tool_call.function.name,
+                                "content": result,
+                            }
+                        )
 
                 # Add assistant message and tool results to chat history
                 self.chat_history.append(ai_message)
@@ -11,7 +11,7 @@ import shutil
 from file_diff import FileDiff, DiffGenerator
 
 
-@dataclass
+@dataclass(slots=True)
 class PatchResult:
     """Result of applying a patch."""
 
@@ -36,9 +36,8 @@ class PatchHandler:
         """
         self.create_backups = create_backups
         self.backup_dir = backup_dir
-
-        if create_backups:
-            Path(backup_dir).mkdir(exist_ok=True)
+        # The backup directory is only created once a backup is first needed
+        self._backup_dir_ready = False
 
     def _create_backup(self, file_path: str) -> Optional[str]:
         """
@@ -51,6 +50,9 @@ class PatchHandler:
             Path to backup file, or None if creation failed
         """
         try:
+            if not self._backup_dir_ready:
+                Path(self.backup_dir).mkdir(exist_ok=True)
+                self._backup_dir_ready = True
             file_path = Path(file_path)
             backup_path = Path(self.backup_dir) / f"{file_path.name}.bak"
             shutil.copy2(file_path, backup_path)
@@ -119,11 +121,11 @@ class PatchHandler:
         result = []
 
         # Build a mapping of old line numbers to content
-        for diff_line in file_diff.lines:
-            if diff_line.line_type == "+":
-                result.append(diff_line.content)
-            elif diff_line.line_type == " ":
-                result.append(diff_line.content)
+        for line_type, content in zip(file_diff.line_types, file_diff.contents):
+            if line_type == "+":
+                result.append(content)
+            elif line_type == " ":
+                result.append(content)
             # Skip '-' lines as they should be removed
 
         return "\n".join(result)
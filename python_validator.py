@@ -1,12 +1,39 @@
 import ast
+import functools
 import subprocess
 import sys
 
+
+@functools.lru_cache(maxsize=1)
+def _ruff_command():
+    """
+    Get the command prefix used to run ruff.
+
+    Runs the ruff binary directly when the ruff package can locate it, so
+    each call doesn't also start a Python interpreter just to exec ruff.
+    Falls back to ``python -m ruff`` otherwise.
+
+    Returns:
+        Tuple of arguments that ruff subcommands are appended to
+    """
+    try:
+        from ruff.__main__ import find_ruff_bin
+
+        return (find_ruff_bin(),)
+    except (ImportError, FileNotFoundError):
+        return (sys.executable, '-m', 'ruff')
+
+
+@functools.lru_cache(maxsize=1)
 def has_ruff():
-    """Check if ruff is available in the environment using uv."""
+    """
+    Check if ruff is available in the environment using uv.
+
+    The answer is cached, so only the first call spawns a subprocess.
+    """
     try:
         # Try to run ruff via uv (if uv is managing packages)
-        result = subprocess.run([sys.executable, '-m', 'ruff', '--version'], 
+        result = subprocess.run([*_ruff_command(), '--version'], 
                               capture_output=True, text=True, check=True)
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
@@ -38,19 +65,24 @@ class PythonValidator:
         except Exception as e:
             return False, f"Validation error: {str(e)}"
     
-    def format_with_ruff(self, code: str) -> tuple[bool, str, str]:
+    def format_with_ruff(self, code: str, filename: str = "temp.py") -> tuple[bool, str, str]:
         """
         Format Python code using ruff formatter via subprocess.
         
+        The code is piped through stdin, so ruff never has to read the file
+        from disk. ``filename`` is only used by ruff to pick up the matching
+        project configuration.
+        
         Args:
             code: Python code string to format
+            filename: Path reported to ruff via --stdin-filename
             
         Returns:
             Tuple containing (success_boolean, formatted_code_or_original, error_message)
         """
         try:
             result = subprocess.run([
-                sys.executable, '-m', 'ruff', 'format', '--stdin-filename', 'temp.py'
+                *_ruff_command(), 'format', '--stdin-filename', str(filename)
             ], input=code, capture_output=True, text=True)
             
             if result.returncode == 0:
@@ -60,12 +92,13 @@ class PythonValidator:
         except Exception as e:
             return False, code, f"Error running ruff formatter: {str(e)}"
 
-    def validate_and_format_python(self, code: str) -> tuple[str, bool, str]:
+    def validate_and_format_python(self, code: str, filename: str = "temp.py") -> tuple[str, bool, str]:
         """
         Primary method to validate and format Python code with ruff.
         
         Args:
             code: Python code to validate and format
+            filename: Path the code will be written to, passed on to ruff
             
         Returns:
             Tuple containing (final_code_or_original_if_invalid, success_boolean, error_message)
@@ -79,7 +112,7 @@ class PythonValidator:
             return code, False, initial_error
         
         # Format the code with ruff
-        success, formatted_code, format_error = self.format_with_ruff(code)
+        success, formatted_code, format_error = self.format_with_ruff(code, filename)
         
         if not success:
             return code, False, format_error
@@ -55,6 +55,17 @@ class TestDiffGenerator(unittest.TestCase):
         self.assertEqual(diff.additions, 2)
         self.assertEqual(diff.deletions, 0)
 
+    def test_diff_rereads_changed_file(self):
+        """Test that a file changed since the last diff is read again."""
+        file1 = self.create_temp_file("file1.txt", "line1\n")
+        file2 = self.create_temp_file("file2.txt", "line1\nline2\n")
+        self.assertEqual(self.diff_gen.diff_files(file1, file2).additions, 1)
+
+        self.create_temp_file("file2.txt", "line1\nline2\nline3\n")
+        diff = self.diff_gen.diff_files(file1, file2)
+
+        self.assertEqual(diff.additions, 2)
+
     def test_diff_deleted_lines(self):
         """Test diff with deleted lines."""
         file1 = self.create_temp_file("file1.txt", "line1\nline2\nline3\n")
@@ -156,6 +167,34 @@ class TestDirectoryDiffer(unittest.TestCase):
         modified = dir_diff.get_modified_files()
         self.assertIn("file.txt", modified)
 
+    def test_unchanged_file_detection(self):
+        """Test that identical files are reported as unchanged."""
+        self.create_file(self.dir1, "same.txt", "content\n")
+        self.create_file(self.dir2, "same.txt", "content\n")
+        self.create_file(self.dir1, "other.txt", "before\n")
+        self.create_file(self.dir2, "other.txt", "after!\n")
+
+        differ = DirectoryDiffer()
+        dir_diff = differ.diff_directories(self.dir1, self.dir2)
+
+        statuses = {entry.file_path: entry.status for entry in dir_diff.entries}
+        self.assertEqual(statuses, {"same.txt": "unchanged", "other.txt": "modified"})
+
+    def test_modified_binary_file_detection(self):
+        """Test that differing binary files are reported as modified."""
+        for dir_path, content in ((self.dir1, b"\0\1\2"), (self.dir2, b"\0\1\3")):
+            with open(os.path.join(dir_path, "bin.dat"), "wb") as f:
+                f.write(content)
+            with open(os.path.join(dir_path, "same.dat"), "wb") as f:
+                f.write(b"\0\1\2")
+
+        differ = DirectoryDiffer()
+        dir_diff = differ.diff_directories(self.dir1, self.dir2)
+
+        statuses = {entry.file_path: entry.status for entry in dir_diff.entries}
+        self.assertEqual(statuses, {"bin.dat": "modified", "same.dat": "unchanged"})
+        self.assertEqual(dir_diff.get_summary()["modified"], 1)
+
 
 class TestThreeWayMerger(unittest.TestCase):
     """Test three-way merge functionality."""
@@ -284,6 +323,16 @@ class TestDiffMergeAPI(unittest.TestCase):
         self.assertIn("file1", report)
         self.assertIn("file2", report)
 
+    def test_diff_recomputed_after_file_change(self):
+        """Test that cached diffs are not reused once a file changes."""
+        file1 = self.create_temp_file("file1.txt", "line1\nline2\n")
+        file2 = self.create_temp_file("file2.txt", "line1\nline2\nline3\n")
+
+        self.assertEqual(self.api.diff_files(file1, file2)["additions"], 1)
+        self.create_temp_file("file2.txt", "line1\nline2\nline3\nline4\n")
+
+        self.assertEqual(self.api.diff_files(file1, file2)["additions"], 2)
+
 
 if __name__ == "__main__":
     unittest.main()
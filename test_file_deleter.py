@@ -0,0 +1,124 @@
+"""
+Test Suite for FileDeleter.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from file_deleter import FileDeleter
+
+
+class TestFileDeleter(unittest.TestCase):
+    """Test deleting files."""
+
+    def setUp(self):
+        self.deleter = FileDeleter()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def create_temp_file(self, name: str, content: str = "") -> str:
+        """Helper to create temporary files."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_delete_file(self):
+        """Test deleting a regular file."""
+        path = self.create_temp_file("file.txt")
+
+        result = self.deleter.delete_file(path)
+
+        self.assertEqual(result, f"Successfully deleted file: {path}")
+        self.assertFalse(os.path.exists(path))
+
+    def test_delete_missing_file(self):
+        """Test the error for a path that doesn't exist."""
+        path = os.path.join(self.temp_dir, "missing.txt")
+
+        result = self.deleter.delete_file(path)
+
+        self.assertEqual(result, f"Error: File '{path}' not found")
+
+    def test_delete_directory_is_rejected(self):
+        """Test that directories are left to delete_directory."""
+        path = os.path.join(self.temp_dir, "sub")
+        os.mkdir(path)
+
+        result = self.deleter.delete_file(path)
+
+        self.assertEqual(result, f"Error: '{path}' is not a file")
+        self.assertTrue(os.path.isdir(path))
+
+    def test_delete_symlinks(self):
+        """Test that symlinks are judged by what they point at."""
+        target = self.create_temp_file("target.txt")
+        sub = os.path.join(self.temp_dir, "sub")
+        os.mkdir(sub)
+        to_file, to_dir, dangling = (
+            os.path.join(self.temp_dir, name) for name in ("f", "d", "x")
+        )
+        os.symlink(target, to_file)
+        os.symlink(sub, to_dir)
+        os.symlink(os.path.join(self.temp_dir, "missing"), dangling)
+
+        self.assertTrue(self.deleter.delete_file(to_file).startswith("Success"))
+        self.assertEqual(
+            self.deleter.delete_file(to_dir), f"Error: '{to_dir}' is not a file"
+        )
+        self.assertEqual(
+            self.deleter.delete_file(dangling), f"Error: File '{dangling}' not found"
+        )
+        self.assertFalse(os.path.lexists(to_file))
+        self.assertTrue(os.path.exists(target))
+        self.assertTrue(os.path.islink(to_dir))
+        self.assertTrue(os.path.islink(dangling))
+
+    def test_delete_files_keeps_order(self):
+        """Test that results come back in the order the paths were given."""
+        paths = [self.create_temp_file(f"file{i}.txt") for i in range(40)]
+        paths.insert(3, os.path.join(self.temp_dir, "missing.txt"))
+
+        result = self.deleter.delete_files(paths)
+
+        expected = [f"Successfully deleted file: {path}" for path in paths]
+        expected[3] = f"Error: File '{paths[3]}' not found"
+        self.assertEqual(result.split("\n"), expected)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_delete_files_single(self):
+        """Test deleting a single file without a thread pool."""
+        path = self.create_temp_file("file.txt")
+
+        result = self.deleter.delete_files([path])
+
+        self.assertEqual(result, f"Successfully deleted file: {path}")
+        self.assertFalse(os.path.exists(path))
+
+    def test_delete_files_empty(self):
+        """Test that an empty list is reported as an error."""
+        self.assertEqual(self.deleter.delete_files([]), "Error: No files given")
+
+    def test_delete_files_rejects_non_lists(self):
+        """Test that a string or other non-list isn't iterated over."""
+        path = self.create_temp_file("a.txt")
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.temp_dir)
+        self.create_temp_file("a")
+
+        for file_paths in ("a.txt", None, ["a.txt", 1]):
+            self.assertEqual(
+                self.deleter.delete_files(file_paths),
+                "Error: file_paths must be a list of path strings",
+            )
+
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["a", "a.txt"])
+        self.assertTrue(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
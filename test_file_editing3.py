@@ -0,0 +1,527 @@
+"""
+Test Suite for the FileEditor line operations.
+"""
+
+import unittest
+import tempfile
+import os
+from unittest.mock import patch
+from file_editing3 import FileEditor
+
+
+class TestFileEditor(unittest.TestCase):
+    """Test FileEditor line editing."""
+
+    def setUp(self):
+        self.editor = FileEditor()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def create_temp_file(self, name: str, content: str) -> str:
+        """Helper to create temporary files."""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def read(self, path: str) -> str:
+        with open(path) as f:
+            return f.read()
+
+    def test_edit_file_append(self):
+        """Test appending content with edit_file."""
+        path = self.create_temp_file("file.txt", "one\n")
+
+        result = self.editor.edit_file(path, "two\n", mode="a")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "one\ntwo\n")
+        self.assertEqual(os.listdir(self.temp_dir), ["file.txt"])
+
+    def test_edit_file_creates_directories(self):
+        """Test that edit_file creates missing parent directories."""
+        path = os.path.join(self.temp_dir, "a", "b", "file.txt")
+
+        result = self.editor.edit_file(path, "one\n")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "one\n")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["file.txt"])
+
+    def test_edit_file_through_symlink(self):
+        """Test that editing a symlinked file keeps the link."""
+        target = self.create_temp_file("target.txt", "one\n")
+        link = os.path.join(self.temp_dir, "link.txt")
+        os.symlink(target, link)
+
+        result = self.editor.change_line(link, 0, "ONE")
+
+        self.assertTrue(result["success"])
+        self.assertTrue(os.path.islink(link))
+        self.assertEqual(self.read(target), "ONE\n")
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["link.txt", "target.txt"])
+
+    def test_edit_file_keeps_hard_links(self):
+        """Test that a hard linked file is updated under every name."""
+        path = self.create_temp_file("file.txt", "one\n")
+        other = os.path.join(self.temp_dir, "other.txt")
+        os.link(path, other)
+
+        result = self.editor.edit_file(path, "two\n")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(other), "two\n")
+
+    def test_edit_file_in_read_only_directory(self):
+        """Test that a writable file is edited where no temp file can be made."""
+        path = self.create_temp_file("file.txt", "one\n")
+        real_open = open
+
+        def deny_temp_files(file, *args, **kwargs):
+            if str(file).endswith(".tmp"):
+                raise PermissionError(13, "Permission denied", file)
+            return real_open(file, *args, **kwargs)
+
+        with patch("builtins.open", deny_temp_files):
+            result = self.editor.edit_file(path, "two\n")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "two\n")
+        self.assertEqual(os.listdir(self.temp_dir), ["file.txt"])
+
+    @unittest.skipIf(os.name == "posix" and os.geteuid() == 0, "root can write")
+    def test_edit_file_read_only(self):
+        """Test that a read-only file is not replaced."""
+        path = self.create_temp_file("file.txt", "one\n")
+        os.chmod(path, 0o444)
+
+        result = self.editor.edit_file(path, "two\n")
+
+        self.assertFalse(result["success"])
+        self.assertEqual(self.read(path), "one\n")
+
+    def test_edit_files_batch(self):
+        """Test writing several files with a single batch call."""
+        existing = self.create_temp_file("file.txt", "one\n")
+        new = os.path.join(self.temp_dir, "sub", "new.txt")
+
+        results = self.editor.edit_files_batch(
+            [
+                {"file_path": existing, "content": "two\n", "mode": "a"},
+                {"file_path": new, "content": "new\n"},
+                {"file_path": new},
+            ]
+        )
+
+        self.assertEqual([r["success"] for r in results], [True, True, False])
+        self.assertEqual(self.read(existing), "one\ntwo\n")
+        self.assertEqual(self.read(new), "new\n")
+
+    def test_edit_files_batch_malformed_edits(self):
+        """Test that malformed batches are reported instead of raising."""
+        if self.editor.python_validator is not None:
+            self.editor.python_validator.available = True
+            self.editor.python_validator.validate_and_format_python = (
+                lambda code, filename: (code, True, "")
+            )
+        path = os.path.join(self.temp_dir, "module.py")
+
+        for edits in (None, "a.py", {"file_path": path, "content": "x = 1\n"}):
+            results = self.editor.edit_files_batch(edits)
+            self.assertEqual(len(results), 1)
+            self.assertFalse(results[0]["success"])
+            self.assertIn("'edits' must be a list", results[0]["message"])
+
+        results = self.editor.edit_files_batch(
+            [
+                "a.py",
+                ["a.py"],
+                {"file_path": path},
+                {"file_path": path, "content": "x = 1\n"},
+                {"file_path": 1, "content": "x = 1\n"},
+            ]
+        )
+
+        self.assertEqual(
+            [r["success"] for r in results], [False, False, False, True, False]
+        )
+        self.assertEqual(self.read(path), "x = 1\n")
+
+    def test_edit_file_append_diff(self):
+        """Test that the append diff only covers the end of the file."""
+        path = self.create_temp_file("file.txt", "".join(f"{i}\n" for i in range(10)))
+
+        result = self.editor.edit_file(path, "10\n", mode="a", include_diff=True)
+
+        self.assertEqual(
+            result["diff"],
+            f"--- a/{path}\n+++ b/{path}\n@@ -8,3 +8,4 @@\n 7\n 8\n 9\n+10\n",
+        )
+
+    def test_change_line(self):
+        """Test changing a line in the middle of a file."""
+        path = self.create_temp_file("file.txt", "one\ntwo\nthree\n")
+
+        result = self.editor.change_line(path, 1, "TWO")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "one\nTWO\nthree\n")
+
+    def test_change_last_line_without_newline(self):
+        """Test changing a final line that has no trailing newline."""
+        path = self.create_temp_file("file.txt", "one\ntwo")
+
+        result = self.editor.change_line(path, 1, "TWO")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "one\nTWO\n")
+
+    def test_change_line_keeps_single_newline(self):
+        """Test that a replacement already ending in a newline isn't doubled."""
+        path = self.create_temp_file("file.txt", "one\ntwo\n")
+
+        self.editor.change_line(path, 0, "ONE\n")
+        self.editor.insert_line(path, 1, "inserted\n")
+
+        self.assertEqual(self.read(path), "ONE\ninserted\ntwo\n")
+
+    def test_change_line_diff(self):
+        """Test the diff returned for a changed line."""
+        path = self.create_temp_file("file.txt", "one\ntwo\nthree\n")
+
+        result = self.editor.change_line(path, 1, "TWO", include_diff=True)
+
+        self.assertEqual(
+            result["diff"],
+            f"--- a/{path}\n+++ b/{path}\n@@ -1,3 +1,3 @@\n"
+            " one\n-two\n+TWO\n three\n",
+        )
+
+    def test_change_line_without_diff(self):
+        """Test that diffs are skipped unless requested."""
+        path = self.create_temp_file("file.txt", "one\ntwo\n")
+
+        result = self.editor.change_line(path, 1, "TWO")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["diff"], "")
+        self.assertEqual(self.read(path), "one\nTWO\n")
+
+    def test_unchanged_content_is_not_rewritten(self):
+        """Test that an edit producing the same content leaves the file alone."""
+        path = self.create_temp_file("file.txt", "one\ntwo\n")
+        os.utime(path, ns=(0, 0))
+
+        result = self.editor.change_line(path, 1, "two")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["diff"], "")
+        self.assertEqual(os.stat(path).st_mtime_ns, 0)
+
+    def test_edit_file_same_content_is_skipped(self):
+        """Test that rewriting the same content or appending nothing is a no-op."""
+        path = self.create_temp_file("module.py", "x=1\n")
+        os.utime(path, ns=(0, 0))
+
+        for content, mode in (("x=1\n", "w"), ("", "a")):
+            result = self.editor.edit_file(path, content, mode=mode)
+            self.assertTrue(result["success"])
+            self.assertTrue(result["message"].startswith("No changes made"))
+
+        self.assertEqual(self.read(path), "x=1\n")
+        self.assertEqual(os.stat(path).st_mtime_ns, 0)
+
+    def test_validation_result_is_reused(self):
+        """Test that content validated once isn't sent to the validator again."""
+        calls = []
+
+        def validate(code, filename):
+            calls.append(code)
+            return code.replace("=", " = "), True, ""
+
+        if self.editor.python_validator is None:
+            self.skipTest("python_validator is not importable")
+        self.editor.python_validator.available = True
+        self.editor.python_validator.validate_and_format_python = validate
+        path = os.path.join(self.temp_dir, "module.py")
+
+        self.editor.edit_file(path, "x=1\n")
+        self.editor.edit_file(path, "y=2\n")
+        result = self.editor.edit_file(path, "x=1\n")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "x = 1\n")
+        self.assertEqual(calls, ["x=1\n", "y=2\n"])
+
+    def test_edit_files_batch_validates_each_file_once(self):
+        """Test that batch validation up front isn't repeated by the edits."""
+        calls = []
+
+        def validate(code, filename):
+            calls.append(filename)
+            return code.replace("=", " = "), True, ""
+
+        if self.editor.python_validator is None:
+            self.skipTest("python_validator is not importable")
+        self.editor.python_validator.available = True
+        self.editor.python_validator.validate_and_format_python = validate
+        paths = [os.path.join(self.temp_dir, f"m{i}.py") for i in range(3)]
+
+        results = self.editor.edit_files_batch(
+            [{"file_path": path, "content": "x=1\n"} for path in paths]
+        )
+
+        self.assertTrue(all(result["success"] for result in results))
+        self.assertEqual(sorted(calls), paths)
+        for path in paths:
+            self.assertEqual(self.read(path), "x = 1\n")
+
+    def test_edit_files_batch_skips_needless_validation(self):
+        """Test that failures aren't validated twice and unchanged files not at all."""
+        calls = []
+
+        def validate(code, filename):
+            calls.append(filename)
+            if "(" in code:
+                return code, False, "syntax error"
+            return code.replace("=", " = "), True, ""
+
+        if self.editor.python_validator is None:
+            self.skipTest("python_validator is not importable")
+        self.editor.python_validator.available = True
+        self.editor.python_validator.validate_and_format_python = validate
+        unchanged = self.create_temp_file("same.py", "x = 1\n")
+        self.editor.read_file(unchanged)
+        broken, fine = (os.path.join(self.temp_dir, f"{n}.py") for n in "ab")
+
+        results = self.editor.edit_files_batch(
+            [
+                {"file_path": unchanged, "content": "x = 1\n"},
+                {"file_path": broken, "content": "x = (\n"},
+                {"file_path": fine, "content": "y=2\n"},
+            ]
+        )
+
+        self.assertEqual([r["success"] for r in results], [True, False, True])
+        self.assertIn("syntax error", results[1]["message"])
+        self.assertEqual(sorted(calls), [broken, fine])
+        self.assertEqual(self.editor._prevalidated, {})
+
+    def test_external_change_invalidates_cache(self):
+        """Test that edits see changes made to the file outside the editor."""
+        path = self.create_temp_file("file.txt", "one\ntwo\n")
+        self.editor.change_line(path, 0, "ONE")
+
+        with open(path, "w") as f:
+            f.write("alpha\nbeta\ngamma\n")
+        result = self.editor.change_line(path, 2, "GAMMA")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "alpha\nbeta\nGAMMA\n")
+
+    def test_content_cache_is_bounded(self):
+        """Test that the content cache keeps only the most recent files."""
+        from file_editing3 import CONTENT_CACHE_MAX_FILES
+
+        paths = [
+            self.create_temp_file(f"file{i}.txt", f"{i}\n")
+            for i in range(CONTENT_CACHE_MAX_FILES + 2)
+        ]
+        for path in paths:
+            self.editor.read_file(path)
+
+        self.assertEqual(
+            list(self.editor._content_cache), paths[-CONTENT_CACHE_MAX_FILES:]
+        )
+        self.assertEqual(self.editor.read_file(paths[0]), "0\n")
+
+    def test_edit_file_starting_with_error(self):
+        """Test that content beginning with "Error" isn't mistaken for a failure."""
+        path = self.create_temp_file("file.txt", "Error: not really\n")
+
+        result = self.editor.insert_line(path, 1, "fine")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "Error: not really\nfine\n")
+
+    def test_missing_file(self):
+        """Test read errors for a missing file."""
+        path = os.path.join(self.temp_dir, "missing.txt")
+
+        self.assertRaises(FileNotFoundError, self.editor.read_file, path)
+        self.assertTrue(self.editor.read_file_safe(path).startswith("Error"))
+        self.assertFalse(self.editor.change_line(path, 0, "x")["success"])
+
+    def test_change_line_out_of_range(self):
+        """Test that out of range line numbers are rejected."""
+        path = self.create_temp_file("file.txt", "one\ntwo\n")
+
+        for line_number in (-1, 2, 10):
+            result = self.editor.change_line(path, line_number, "x")
+            self.assertFalse(result["success"])
+
+        self.assertEqual(self.read(path), "one\ntwo\n")
+
+    def test_insert_line_after_last_line_without_newline(self):
+        """Test that inserting past the end keeps the old last line intact."""
+        path = self.create_temp_file("file.txt", "one\ntwo")
+
+        result = self.editor.insert_line(path, 10, "three")
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "one\ntwo\nthree\n")
+
+    def test_apply_edits(self):
+        """Test that line numbers refer to the file before any edit."""
+        path = self.create_temp_file("file.txt", "one\ntwo\nthree\n")
+
+        result = self.editor.apply_edits(
+            path,
+            [
+                {"op": "insert", "line_number": 0, "content": "zero"},
+                {"op": "remove", "line_number": 1},
+                {"op": "change", "line_number": 2, "content": "THREE"},
+            ],
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "zero\none\nTHREE\n")
+
+    def test_apply_edits_invalid_edit_leaves_file(self):
+        """Test that one bad edit stops the whole batch."""
+        path = self.create_temp_file("file.txt", "one\ntwo\n")
+
+        result = self.editor.apply_edits(
+            path,
+            [
+                {"op": "change", "line_number": 0, "content": "ONE"},
+                {"op": "remove", "line_number": 5},
+            ],
+        )
+
+        self.assertFalse(result["success"])
+        self.assertEqual(self.read(path), "one\ntwo\n")
+
+    def test_apply_edits_insert_and_remove_same_line(self):
+        """Test that an insert goes before the line removed at the same number."""
+        path = self.create_temp_file("file.txt", "a\nb\nc\n")
+
+        result = self.editor.apply_edits(
+            path,
+            [
+                {"op": "insert", "line_number": 1, "content": "X"},
+                {"op": "remove", "line_number": 1},
+            ],
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "a\nX\nc\n")
+
+    def test_apply_edits_insert_and_change_same_line(self):
+        """Test that inserts keep their order and go before a changed line."""
+        path = self.create_temp_file("file.txt", "a\nb\nc\n")
+
+        result = self.editor.apply_edits(
+            path,
+            [
+                {"op": "change", "line_number": 1, "content": "B"},
+                {"op": "insert", "line_number": 1, "content": "X"},
+                {"op": "insert", "line_number": 1, "content": "Y"},
+            ],
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "a\nX\nY\nB\nc\n")
+
+    def test_apply_edits_rejects_duplicate_remove(self):
+        """Test that a line can only be removed or changed once."""
+        path = self.create_temp_file("file.txt", "a\nb\nc\n")
+
+        for op in ("remove", "change"):
+            result = self.editor.apply_edits(
+                path,
+                [
+                    {"op": "remove", "line_number": 1},
+                    {"op": op, "line_number": 1, "content": "B"},
+                ],
+            )
+            self.assertFalse(result["success"])
+            self.assertIn("more than once", result["message"])
+
+        self.assertEqual(self.read(path), "a\nb\nc\n")
+
+    def test_apply_edits_inserts_past_end_keep_order(self):
+        """Test that inserts past the last line come out in line number order."""
+        path = self.create_temp_file("file.txt", "a\nb")
+
+        result = self.editor.apply_edits(
+            path,
+            [
+                {"op": "insert", "line_number": 7, "content": "Z"},
+                {"op": "insert", "line_number": 5, "content": "X"},
+                {"op": "insert", "line_number": 5, "content": "Y"},
+                {"op": "insert", "line_number": 2, "content": "W"},
+            ],
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "a\nb\nW\nX\nY\nZ\n")
+
+    def test_apply_edits_around_last_line(self):
+        """Test edits next to a last line with and without a trailing newline."""
+        edits = [
+            {"op": "insert", "line_number": 9, "content": "X"},
+            {"op": "change", "line_number": 1, "content": "B"},
+            {"op": "insert", "line_number": 2, "content": "W"},
+            {"op": "remove", "line_number": 0},
+        ]
+
+        for content in ("a\nb", "a\nb\n"):
+            path = self.create_temp_file("file.txt", content)
+            result = self.editor.apply_edits(path, edits)
+            self.assertTrue(result["success"])
+            self.assertEqual(self.read(path), "B\nW\nX\n")
+
+        path = self.create_temp_file("empty.txt", "")
+        result = self.editor.apply_edits(path, edits[:1] + edits[2:3])
+        self.assertTrue(result["success"])
+        self.assertEqual(self.read(path), "W\nX\n")
+
+    def test_apply_edits_malformed_edit(self):
+        """Test that malformed edits are reported without touching the file."""
+        path = self.create_temp_file("file.txt", "a\nb\n")
+
+        for edit, message in (
+            (
+                {"op": "change", "line_number": 0},
+                "Error: Edit 0 needs a string 'content'",
+            ),
+            ({"op": "remove", "line_number": "0"}, "Error: Edit 0 needs an integer"),
+            ({"op": "move", "line_number": 0}, "Error: Unknown edit operation 'move'"),
+            ("remove 0", "Error: Edit 0 is not an object"),
+        ):
+            result = self.editor.apply_edits(path, [edit])
+            self.assertFalse(result["success"])
+            self.assertTrue(result["message"].startswith(message), result["message"])
+
+        self.assertEqual(self.read(path), "a\nb\n")
+
+    def test_remove_line_diff(self):
+        """Test the diff returned for a removed line."""
+        path = self.create_temp_file("file.txt", "one\ntwo\nthree\n")
+
+        result = self.editor.remove_line(path, 1, include_diff=True)
+
+        self.assertEqual(self.read(path), "one\nthree\n")
+        self.assertEqual(
+            result["diff"],
+            f"--- a/{path}\n+++ b/{path}\n@@ -1,3 +1,2 @@\n one\n-two\n three\n",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Test Suite for FileReader.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from file_reader import FileReader
+
+
+class TestFileReader(unittest.TestCase):
+    """Test reading whole files and line ranges."""
+
+    def setUp(self):
+        self.reader = FileReader()
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "file.txt")
+        with open(self.path, "w") as f:
+            f.write("".join(f"line{i}\n" for i in range(5)))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_read_whole_file(self):
+        """Test that the whole file is returned by default."""
+        self.assertEqual(
+            self.reader.read_file(self.path), "line0\nline1\nline2\nline3\nline4\n"
+        )
+
+    def test_read_from_offset(self):
+        """Test reading from an offset to the end of the file."""
+        self.assertEqual(self.reader.read_file(self.path, offset=3), "line3\nline4\n")
+
+    def test_read_offset_and_length(self):
+        """Test reading a limited number of lines from an offset."""
+        self.assertEqual(
+            self.reader.read_file(self.path, offset=1, length=2), "line1\nline2\n"
+        )
+        self.assertEqual(self.reader.read_file(self.path, length=0), "")
+
+    def test_read_offset_past_end(self):
+        """Test that an offset past the last line reads nothing."""
+        self.assertEqual(self.reader.read_file(self.path, offset=10), "")
+        self.assertEqual(self.reader.read_file(self.path, offset=10, length=3), "")
+
+    def test_read_invalid_range(self):
+        """Test that negative or non-integer ranges get a clear error."""
+        for kwargs, name in (
+            ({"offset": -1}, "offset"),
+            ({"offset": "2"}, "offset"),
+            ({"length": -1}, "length"),
+            ({"offset": 1, "length": 1.5}, "length"),
+        ):
+            self.assertEqual(
+                self.reader.read_file(self.path, **kwargs),
+                f"Error: '{name}' must be a non-negative integer",
+            )
+
+    def test_read_missing_file(self):
+        """Test the error for a path that doesn't exist."""
+        path = os.path.join(self.temp_dir, "missing.txt")
+
+        self.assertEqual(self.reader.read_file(path), f"Error: File '{path}' not found")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Test Suite for the ruff command built by python_validator.
+"""
+
+import subprocess
+import sys
+import types
+import unittest
+from unittest.mock import patch
+
+import python_validator
+
+
+class TestRuffCommand(unittest.TestCase):
+    """Test how the ruff command line is put together."""
+
+    def setUp(self):
+        python_validator._ruff_command.cache_clear()
+        self.addCleanup(python_validator._ruff_command.cache_clear)
+
+    def fake_ruff(self, find_ruff_bin):
+        """Install a stand-in for ruff.__main__ with the given find_ruff_bin."""
+        main = types.ModuleType("ruff.__main__")
+        main.find_ruff_bin = find_ruff_bin
+        return patch.dict(
+            sys.modules, {"ruff": types.ModuleType("ruff"), "ruff.__main__": main}
+        )
+
+    def test_runs_ruff_binary(self):
+        """Test that the binary found by the ruff package is run directly."""
+        with self.fake_ruff(lambda: "/opt/bin/ruff"):
+            self.assertEqual(python_validator._ruff_command(), ("/opt/bin/ruff",))
+
+    def test_falls_back_to_module(self):
+        """Test the python -m ruff fallback when ruff can't be located."""
+
+        def missing():
+            raise FileNotFoundError
+
+        fallback = (sys.executable, "-m", "ruff")
+        with self.fake_ruff(missing):
+            self.assertEqual(python_validator._ruff_command(), fallback)
+
+        python_validator._ruff_command.cache_clear()
+        with patch.dict(sys.modules, {"ruff": None, "ruff.__main__": None}):
+            self.assertEqual(python_validator._ruff_command(), fallback)
+
+    def test_format_command(self):
+        """Test the command format_with_ruff runs."""
+        completed = subprocess.CompletedProcess([], 0, stdout="x = 1\n", stderr="")
+        validator = python_validator.PythonValidator.__new__(
+            python_validator.PythonValidator
+        )
+
+        with self.fake_ruff(lambda: "/opt/bin/ruff"), patch(
+            "subprocess.run", return_value=completed
+        ) as run:
+            result = validator.format_with_ruff("x=1\n", "pkg/module.py")
+
+        self.assertEqual(result, (True, "x = 1\n", ""))
+        self.assertEqual(
+            run.call_args.args[0],
+            ["/opt/bin/ruff", "format", "--stdin-filename", "pkg/module.py"],
+        )
+        self.assertEqual(run.call_args.kwargs["input"], "x=1\n")
+
+
+if __name__ == "__main__":
+    unittest.main()